@@ -324,7 +324,7 @@ class CLIDocumentationGenerator:
             logger.info("🔍 Stage 2: Module Clustering with LLM")
 
         # Import clustering function
-        from codewiki.src.be.cluster_modules import cluster_modules
+        from codewiki.src.be.cluster_modules import cluster_modules_async
         from codewiki.src.utils import file_manager
         from codewiki.src.config import FIRST_MODULE_TREE_FILENAME, MODULE_TREE_FILENAME
 
@@ -357,7 +357,7 @@ class CLIDocumentationGenerator:
 
                 import time
                 start_time = time.time()
-                module_tree = cluster_modules(leaf_nodes, components, backend_config)
+                module_tree = await cluster_modules_async(leaf_nodes, components, backend_config)
                 elapsed = time.time() - start_time
 
                 file_manager.save_json(module_tree, first_module_tree_path)
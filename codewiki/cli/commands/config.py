@@ -5,9 +5,10 @@ Configuration commands for CodeWiki CLI.
 import json
 import sys
 import click
+from dataclasses import replace
 from typing import Optional, List
 
-from codewiki.cli.config_manager import ConfigManager
+from codewiki.cli.config_manager import get_default_manager
 from codewiki.cli.models.config import AgentInstructions
 from codewiki.cli.utils.errors import (
     ConfigurationError, 
@@ -500,7 +501,7 @@ def config_set(
 
         # FAIL-FAST VALIDATION: Require per-provider API keys when per-provider base URLs are set
         # Load existing config to check combined state
-        manager = ConfigManager()
+        manager = get_default_manager()
         manager.load()
         existing_config = manager.get_config()
 
@@ -684,7 +685,7 @@ def config_show(output_json: bool):
     $ codewiki config show --json
     """
     try:
-        manager = ConfigManager()
+        manager = get_default_manager()
         
         if not manager.load():
             click.secho("\n✗ Configuration not found.", fg="red", err=True)
@@ -858,7 +859,7 @@ def config_validate(quick: bool, verbose: bool):
         click.secho("Validating configuration...", fg="blue", bold=True)
         click.echo()
         
-        manager = ConfigManager()
+        manager = get_default_manager()
         
         # Step 1: Check config file
         if verbose:
@@ -1191,7 +1192,7 @@ def config_agent(
     $ codewiki config agent --clear
     """
     try:
-        manager = ConfigManager()
+        manager = get_default_manager()
         
         if not manager.load():
             click.secho("\n✗ Configuration not found.", fg="red", err=True)
@@ -1237,21 +1238,23 @@ def config_agent(
             click.echo()
             return
         
-        # Update agent instructions
+        # Update agent instructions (AgentInstructions is immutable, so
+        # build the changed fields and replace in one step)
         current = config.agent_instructions or AgentInstructions()
-        
+
+        updates = {}
         if include is not None:
-            current.include_patterns = parse_patterns(include) if include else None
+            updates['include_patterns'] = parse_patterns(include) if include else None
         if exclude is not None:
-            current.exclude_patterns = parse_patterns(exclude) if exclude else None
+            updates['exclude_patterns'] = parse_patterns(exclude) if exclude else None
         if focus is not None:
-            current.focus_modules = parse_patterns(focus) if focus else None
+            updates['focus_modules'] = parse_patterns(focus) if focus else None
         if doc_type is not None:
-            current.doc_type = doc_type if doc_type else None
+            updates['doc_type'] = doc_type if doc_type else None
         if instructions is not None:
-            current.custom_instructions = instructions if instructions else None
-        
-        config.agent_instructions = current
+            updates['custom_instructions'] = instructions if instructions else None
+
+        config.agent_instructions = replace(current, **updates)
         manager.save()
         
         # Display success messages
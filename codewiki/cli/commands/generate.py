@@ -10,7 +10,7 @@ from typing import Optional, List, Tuple
 import click
 import time
 
-from codewiki.cli.config_manager import ConfigManager
+from codewiki.cli.config_manager import get_default_manager
 from codewiki.cli.utils.errors import (
     ConfigurationError,
     RepositoryError,
@@ -230,7 +230,7 @@ def generate_command(
             logger.debug("🔍 Stage 1.1: Configuration Validation")
 
         # Load configuration
-        config_manager = ConfigManager()
+        config_manager = get_default_manager()
         if verbose:
             logger.debug("├─ Loading configuration from ~/.codewiki/config.json")
 
@@ -3,6 +3,8 @@ Configuration manager with keyring integration for secure credential storage.
 """
 
 import json
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import keyring
@@ -25,6 +27,17 @@ CONFIG_FILE = CONFIG_DIR / "config.json"
 CONFIG_VERSION = "1.0"
 
 
+@lru_cache(maxsize=4)
+def _read_config_file(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a config JSON file once per (path, mtime, size).
+
+    Repeated load() calls in the same process only pay a stat() to validate
+    freshness instead of re-reading and re-decoding the JSON.
+    """
+    return json.loads(safe_read(Path(path)))
+
+
 class ConfigManager:
     """
     Manages CodeWiki configuration with secure keyring storage for API keys.
@@ -40,18 +53,49 @@ class ConfigManager:
         self._cluster_api_key: Optional[str] = None
         self._main_api_key: Optional[str] = None
         self._fallback_api_key: Optional[str] = None
-        self._config: Optional[Configuration] = None
-        self._keyring_available = self._check_keyring_available()
-    
-    def _check_keyring_available(self) -> bool:
-        """Check if system keyring is available."""
-        try:
-            # Try to get/set a test value
-            keyring.get_password(KEYRING_SERVICE, "__test__")
-            return True
-        except KeyringError:
-            return False
-    
+        # Raw parsed config.json; Configuration is materialized lazily from it
+        # on first _config access (see the _config property below)
+        self._config_data: Optional[dict] = None
+        self._config_obj: Optional[Configuration] = None
+        # Keyring accounts known to hold a key, so delete_api_keys() can skip
+        # IPC round trips for keys that were never set. Only trusted once
+        # _keys_known is True (i.e., we actually observed keyring state).
+        self._keys_present: set = set()
+        self._keys_known: bool = False
+        self._keys_loaded: bool = False
+        # Guards the one-time keyring fetch; the default manager is shared
+        # across threads (e.g., background workers)
+        self._keys_lock = threading.Lock()
+        # Whether load() has already run, so save() can skip a redundant
+        # CONFIG_FILE.exists() + re-load when the answer is already known
+        self._load_attempted: bool = False
+        # None until keyring availability has been observed; inferred from the
+        # first real keyring operation instead of a dedicated probe at init
+        self._keyring_available: Optional[bool] = None
+
+    @property
+    def _config(self) -> Optional[Configuration]:
+        """
+        Lazily materialized Configuration.
+
+        load() only stores the parsed JSON dict; the full Configuration (with
+        type coercion and validation) is built on first access here and
+        memoized. Fast paths that only need a field or two (e.g.,
+        is_configured()) can read self._config_data directly and skip
+        materialization entirely.
+        """
+        if self._config_obj is None and self._config_data is not None:
+            self._config_obj = Configuration.from_dict(self._config_data)
+        return self._config_obj
+
+    @_config.setter
+    def _config(self, value: Optional[Configuration]):
+        self._config_obj = value
+        if value is None:
+            # Drop raw data too, otherwise the property would re-materialize
+            # a Configuration from stale JSON
+            self._config_data = None
+
     def load(self) -> bool:
         """
         Load configuration from file and keyring.
@@ -59,29 +103,31 @@ class ConfigManager:
         Returns:
             True if configuration exists, False otherwise
         """
-        # Load from JSON file
-        if not CONFIG_FILE.exists():
+        self._load_attempted = True
+
+        # Load from JSON file; the stat doubles as the cache freshness check
+        try:
+            st = CONFIG_FILE.stat()
+        except OSError:
             return False
-        
+
         try:
-            content = safe_read(CONFIG_FILE)
-            data = json.loads(content)
-            
+            # Shallow-copy so in-place updates (e.g., key fingerprint resets)
+            # never leak into the process-level cache
+            data = dict(_read_config_file(str(CONFIG_FILE), st.st_mtime_ns, st.st_size))
+
             # Validate version
             if data.get('version') != CONFIG_VERSION:
                 # Could implement migration here
                 pass
             
-            self._config = Configuration.from_dict(data)
+            # Defer Configuration construction until something actually needs
+            # the full object; hot checks read the raw dict instead
+            self._config_data = data
+            self._config_obj = None
 
-            # Load per-provider API keys from keyring
-            try:
-                self._cluster_api_key = keyring.get_password(KEYRING_SERVICE, KEYRING_CLUSTER_API_KEY_ACCOUNT)
-                self._main_api_key = keyring.get_password(KEYRING_SERVICE, KEYRING_MAIN_API_KEY_ACCOUNT)
-                self._fallback_api_key = keyring.get_password(KEYRING_SERVICE, KEYRING_FALLBACK_API_KEY_ACCOUNT)
-            except KeyringError:
-                # Keyring unavailable, API keys will be None
-                pass
+            # API keys are fetched lazily from the keyring on first access
+            # (see _load_all_keys), not here
 
             return True
         except (json.JSONDecodeError, FileSystemError) as e:
@@ -157,11 +203,12 @@ class ConfigManager:
         except FileSystemError as e:
             raise ConfigurationError(f"Cannot create config directory: {e}")
         
-        # Load existing config or create new
+        # Load existing config or create new; skip the disk check entirely
+        # when a previous load() already determined there is nothing to load
         if self._config is None:
-            if CONFIG_FILE.exists():
+            if not self._load_attempted and CONFIG_FILE.exists():
                 self.load()
-            else:
+            if self._config is None:
                 from codewiki.cli.models.config import AgentInstructions
                 self._config = Configuration(
                     main_model="",
@@ -246,15 +293,23 @@ class ConfigManager:
             if cluster_api_key is not None:
                 self._cluster_api_key = cluster_api_key
                 keyring.set_password(KEYRING_SERVICE, KEYRING_CLUSTER_API_KEY_ACCOUNT, cluster_api_key)
+                self._keys_present.add(KEYRING_CLUSTER_API_KEY_ACCOUNT)
+                self._config.has_cluster_key = True
 
             if main_api_key is not None:
                 self._main_api_key = main_api_key
                 keyring.set_password(KEYRING_SERVICE, KEYRING_MAIN_API_KEY_ACCOUNT, main_api_key)
+                self._keys_present.add(KEYRING_MAIN_API_KEY_ACCOUNT)
+                self._config.has_main_key = True
 
             if fallback_api_key is not None:
                 self._fallback_api_key = fallback_api_key
                 keyring.set_password(KEYRING_SERVICE, KEYRING_FALLBACK_API_KEY_ACCOUNT, fallback_api_key)
+                self._keys_present.add(KEYRING_FALLBACK_API_KEY_ACCOUNT)
+                self._config.has_fallback_key = True
+            self._keyring_available = True
         except KeyringError as e:
+            self._keyring_available = False
             raise ConfigurationError(
                 f"System keychain unavailable: {e}\n"
                 f"Please ensure your system keychain is properly configured."
@@ -271,31 +326,63 @@ class ConfigManager:
         except FileSystemError as e:
             raise ConfigurationError(f"Failed to save configuration: {e}")
     
+    def _load_all_keys(self):
+        """
+        Fetch all per-provider API keys from the keyring in one pass.
+
+        Runs at most once per manager; the getters afterwards are plain
+        attribute reads with no per-call try/except frame. Keys already held
+        in memory (e.g., just written by save()) are not re-fetched.
+        """
+        if self._keys_loaded:
+            return
+
+        with self._keys_lock:
+            if self._keys_loaded:
+                return
+            self._fetch_keys_locked()
+            self._keys_loaded = True
+
+    def _fetch_keys_locked(self):
+        """Perform the actual keyring reads; caller holds _keys_lock."""
+        try:
+            if self._cluster_api_key is None:
+                self._cluster_api_key = keyring.get_password(KEYRING_SERVICE, KEYRING_CLUSTER_API_KEY_ACCOUNT)
+            if self._main_api_key is None:
+                self._main_api_key = keyring.get_password(KEYRING_SERVICE, KEYRING_MAIN_API_KEY_ACCOUNT)
+            if self._fallback_api_key is None:
+                self._fallback_api_key = keyring.get_password(KEYRING_SERVICE, KEYRING_FALLBACK_API_KEY_ACCOUNT)
+            # Record which accounts actually hold keys so later deletes can
+            # skip the absent ones
+            self._keys_present = {
+                account for account, value in (
+                    (KEYRING_CLUSTER_API_KEY_ACCOUNT, self._cluster_api_key),
+                    (KEYRING_MAIN_API_KEY_ACCOUNT, self._main_api_key),
+                    (KEYRING_FALLBACK_API_KEY_ACCOUNT, self._fallback_api_key),
+                ) if value is not None
+            }
+            self._keys_known = True
+            self._keyring_available = True
+        except KeyringError:
+            # Keyring unavailable, API keys stay None
+            self._keyring_available = False
+
     def get_cluster_api_key(self) -> Optional[str]:
         """Get cluster model API key from keyring."""
-        if self._cluster_api_key is None:
-            try:
-                self._cluster_api_key = keyring.get_password(KEYRING_SERVICE, KEYRING_CLUSTER_API_KEY_ACCOUNT)
-            except KeyringError:
-                pass
+        if not self._keys_loaded:
+            self._load_all_keys()
         return self._cluster_api_key
 
     def get_main_api_key(self) -> Optional[str]:
         """Get main/generation model API key from keyring."""
-        if self._main_api_key is None:
-            try:
-                self._main_api_key = keyring.get_password(KEYRING_SERVICE, KEYRING_MAIN_API_KEY_ACCOUNT)
-            except KeyringError:
-                pass
+        if not self._keys_loaded:
+            self._load_all_keys()
         return self._main_api_key
 
     def get_fallback_api_key(self) -> Optional[str]:
         """Get fallback model API key from keyring."""
-        if self._fallback_api_key is None:
-            try:
-                self._fallback_api_key = keyring.get_password(KEYRING_SERVICE, KEYRING_FALLBACK_API_KEY_ACCOUNT)
-            except KeyringError:
-                pass
+        if not self._keys_loaded:
+            self._load_all_keys()
         return self._fallback_api_key
 
 
@@ -315,27 +402,87 @@ class ConfigManager:
         Returns:
             True if configured, False otherwise
         """
-        if self._config is None:
+        if self._config_obj is None and self._config_data is None:
             return False
 
+        # Fast path: if config.json records that all three keys were stored
+        # in the keyring, trust the fingerprint and skip the keyring round
+        # trips. Actual key retrieval still validates on the use path.
+        if self._config_obj is not None:
+            has_key_flags = (
+                self._config_obj.has_cluster_key,
+                self._config_obj.has_main_key,
+                self._config_obj.has_fallback_key,
+            )
+        else:
+            has_key_flags = (
+                self._config_data.get('has_cluster_key'),
+                self._config_data.get('has_main_key'),
+                self._config_data.get('has_fallback_key'),
+            )
+        if all(has_key_flags):
+            return self._is_complete_fast()
+
         # Check if per-provider API keys are set
         if not all([self.get_cluster_api_key(), self.get_main_api_key(), self.get_fallback_api_key()]):
             return False
 
         # Check if config is complete
+        return self._is_complete_fast()
+
+    def _is_complete_fast(self) -> bool:
+        """
+        Check config completeness without materializing a Configuration.
+
+        Completeness only needs the three model names, so when only the raw
+        config.json dict is loaded we read it directly.
+        """
+        if self._config_obj is None and self._config_data is not None:
+            return bool(
+                self._config_data.get('main_model') and
+                self._config_data.get('cluster_model') and
+                self._config_data.get('fallback_model')
+            )
         return self._config.is_complete()
 
     def delete_api_keys(self):
         """Delete all per-provider API keys from keyring."""
+        all_accounts = (
+            KEYRING_CLUSTER_API_KEY_ACCOUNT,
+            KEYRING_MAIN_API_KEY_ACCOUNT,
+            KEYRING_FALLBACK_API_KEY_ACCOUNT,
+        )
+        # Only issue deletes for accounts known to hold a key; when keyring
+        # state was never observed, fall back to deleting everything
+        if self._keys_known:
+            accounts_to_delete = [a for a in all_accounts if a in self._keys_present]
+        else:
+            accounts_to_delete = list(all_accounts)
+
         try:
-            keyring.delete_password(KEYRING_SERVICE, KEYRING_CLUSTER_API_KEY_ACCOUNT)
-            keyring.delete_password(KEYRING_SERVICE, KEYRING_MAIN_API_KEY_ACCOUNT)
-            keyring.delete_password(KEYRING_SERVICE, KEYRING_FALLBACK_API_KEY_ACCOUNT)
-            self._cluster_api_key = None
-            self._main_api_key = None
-            self._fallback_api_key = None
+            for account in accounts_to_delete:
+                keyring.delete_password(KEYRING_SERVICE, account)
         except KeyringError:
             pass
+
+        self._keys_present.clear()
+        self._keys_known = True
+        # Deleted keys are known-absent; no point re-fetching them later
+        self._keys_loaded = True
+        self._cluster_api_key = None
+        self._main_api_key = None
+        self._fallback_api_key = None
+
+        # Invalidate the persisted fingerprint so is_configured() does not
+        # keep reporting keys that no longer exist
+        if self._config_obj is not None:
+            self._config_obj.has_cluster_key = False
+            self._config_obj.has_main_key = False
+            self._config_obj.has_fallback_key = False
+        if self._config_data is not None:
+            self._config_data['has_cluster_key'] = False
+            self._config_data['has_main_key'] = False
+            self._config_data['has_fallback_key'] = False
     
     def clear(self):
         """Clear all configuration (file and keyring)."""
@@ -354,6 +501,14 @@ class ConfigManager:
     @property
     def keyring_available(self) -> bool:
         """Check if keyring is available."""
+        if self._keyring_available is None:
+            # No real keyring operation has run yet; probe once on demand
+            # rather than unconditionally at construction time
+            try:
+                keyring.get_password(KEYRING_SERVICE, "__test__")
+                self._keyring_available = True
+            except KeyringError:
+                self._keyring_available = False
         return self._keyring_available
     
     @property
@@ -361,3 +516,17 @@ class ConfigManager:
         """Get configuration file path."""
         return CONFIG_FILE
 
+
+# Module-level default manager, shared across CLI subcommands so the keyring
+# probe and config/credential caches are paid for once per process.
+# ConfigManager() remains public for tests and callers that need isolation.
+_default_manager: Optional[ConfigManager] = None
+
+
+def get_default_manager() -> ConfigManager:
+    """Get the shared ConfigManager instance, creating it lazily."""
+    global _default_manager
+    if _default_manager is None:
+        _default_manager = ConfigManager()
+    return _default_manager
+
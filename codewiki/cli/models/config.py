@@ -6,28 +6,54 @@ user settings stored in ~/.codewiki/config.json. These settings are converted
 to the backend Config class when running documentation generation.
 """
 
-from dataclasses import dataclass, asdict, field
-from typing import Optional, List
+import json
+import os
+import sys
+from dataclasses import dataclass, asdict, field, replace
+from functools import lru_cache
+from typing import Optional, List, Union
 from pathlib import Path
 
+from pydantic import BaseModel, ConfigDict, Field
+
 from codewiki.cli.utils.validation import (
     validate_url,
     validate_api_key,
     validate_model_name,
 )
 
+# Backend Config class, resolved lazily by _backend_config_cls(). Importing
+# codewiki.src.config has import-time side effects (it loads dotenv and
+# prints guideline warnings), so it must stay out of CLI module import; the
+# cached global avoids re-running the import machinery on every
+# to_backend_config call.
+_Config = None
+
+
+def _backend_config_cls():
+    """Return the backend Config class, importing it once on first use."""
+    global _Config
+    if _Config is None:
+        from codewiki.src.config import Config
+        _Config = Config
+    return _Config
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentInstructions:
     """
     Custom instructions for the documentation agent.
-    
+
+    Immutable and slotted: instances are plain value objects, so attribute
+    access is a C-level slot lookup and equal instruction sets hash/compare
+    by value (when their fields are hashable).
+
     Allows users to customize:
     - File filtering (include/exclude patterns)
     - Module focus (prioritize certain modules)
     - Documentation type (API docs, architecture docs, etc.)
     - Custom instructions for the LLM
-    
+
     Attributes:
         include_patterns: File patterns to include (e.g., ["*.cs", "*.py"])
         exclude_patterns: File/directory patterns to exclude (e.g., ["*Tests*", "*test*"])
@@ -42,71 +68,144 @@ class AgentInstructions:
     custom_instructions: Optional[str] = None  # Free-form instructions
     
     def to_dict(self) -> dict:
-        """Convert to dictionary, excluding None values."""
-        result = {}
-        if self.include_patterns:
-            result['include_patterns'] = self.include_patterns
-        if self.exclude_patterns:
-            result['exclude_patterns'] = self.exclude_patterns
-        if self.focus_modules:
-            result['focus_modules'] = self.focus_modules
-        if self.doc_type:
-            result['doc_type'] = self.doc_type
-        if self.custom_instructions:
-            result['custom_instructions'] = self.custom_instructions
-        return result
-    
+        """Convert to dictionary, excluding None/empty values."""
+        return {
+            name: value for name in self.__dataclass_fields__
+            if (value := getattr(self, name))
+        }
+
     @classmethod
     def from_dict(cls, data: dict) -> 'AgentInstructions':
-        """Create AgentInstructions from dictionary."""
-        return cls(
-            include_patterns=data.get('include_patterns'),
-            exclude_patterns=data.get('exclude_patterns'),
-            focus_modules=data.get('focus_modules'),
-            doc_type=data.get('doc_type'),
-            custom_instructions=data.get('custom_instructions'),
-        )
-    
+        """Create AgentInstructions from dictionary, ignoring unknown keys."""
+        return cls(**{name: data.get(name) for name in cls.__dataclass_fields__})
+
     def is_empty(self) -> bool:
         """Check if all fields are empty/None."""
-        return not any([
-            self.include_patterns,
-            self.exclude_patterns,
-            self.focus_modules,
-            self.doc_type,
-            self.custom_instructions,
-        ])
+        return not any(getattr(self, name) for name in self.__dataclass_fields__)
     
     def get_prompt_addition(self) -> str:
         """Generate prompt additions based on instructions."""
-        additions = []
-        
-        if self.doc_type:
-            doc_type_instructions = {
-                'api': "Focus on API documentation: endpoints, parameters, return types, and usage examples.",
-                'architecture': "Focus on architecture documentation: system design, component relationships, and data flow.",
-                'user-guide': "Focus on user guide documentation: how to use features, step-by-step tutorials.",
-                'developer': "Focus on developer documentation: code structure, contribution guidelines, and implementation details.",
-            }
-            if self.doc_type.lower() in doc_type_instructions:
-                additions.append(doc_type_instructions[self.doc_type.lower()])
-            else:
-                additions.append(f"Focus on generating {self.doc_type} documentation.")
-        
-        if self.focus_modules:
-            additions.append(f"Pay special attention to and provide more detailed documentation for these modules: {', '.join(self.focus_modules)}")
-        
-        if self.custom_instructions:
-            additions.append(f"Additional instructions: {self.custom_instructions}")
-        
-        return "\n".join(additions) if additions else ""
-
-
-@dataclass
+        # The composed string is deterministic given these fields; the
+        # module-level helper memoizes it so repeated agent/orchestrator
+        # spawns skip the formatting
+        return _compose_prompt_addition(
+            self.doc_type,
+            tuple(self.focus_modules) if self.focus_modules else None,
+            self.custom_instructions,
+        )
+
+
+# Canned prompt additions per doc_type, keyed by lowercased value; built
+# once at import instead of per get_prompt_addition call
+_DOC_TYPE_INSTRUCTIONS = {
+    'api': "Focus on API documentation: endpoints, parameters, return types, and usage examples.",
+    'architecture': "Focus on architecture documentation: system design, component relationships, and data flow.",
+    'user-guide': "Focus on user guide documentation: how to use features, step-by-step tutorials.",
+    'developer': "Focus on developer documentation: code structure, contribution guidelines, and implementation details.",
+}
+
+
+@lru_cache(maxsize=16)
+def _compose_prompt_addition(doc_type: Optional[str],
+                             focus_modules: Optional[tuple],
+                             custom_instructions: Optional[str]) -> str:
+    """Compose the prompt-addition string for AgentInstructions, memoized."""
+    additions = []
+
+    if doc_type:
+        canned = _DOC_TYPE_INSTRUCTIONS.get(doc_type.lower())
+        if canned is not None:
+            additions.append(canned)
+        else:
+            additions.append(f"Focus on generating {doc_type} documentation.")
+
+    if focus_modules:
+        additions.append(f"Pay special attention to and provide more detailed documentation for these modules: {', '.join(focus_modules)}")
+
+    if custom_instructions:
+        additions.append(f"Additional instructions: {custom_instructions}")
+
+    return "\n".join(additions) if additions else ""
+
+
+class _MergedInstructions:
+    """
+    Attribute-level overlay of runtime agent instructions on persistent ones.
+
+    Attribute reads resolve to the runtime value when set, falling back to
+    the persistent value; no merged AgentInstructions is allocated. Only the
+    read-side AgentInstructions API that to_backend_config needs (attribute
+    access and to_dict) is provided.
+    """
+    __slots__ = ('_runtime', '_persistent')
+
+    def __init__(self, runtime: AgentInstructions, persistent: AgentInstructions):
+        self._runtime = runtime
+        self._persistent = persistent
+
+    def __getattr__(self, name):
+        value = getattr(self._runtime, name)
+        return value if value else getattr(self._persistent, name)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary, excluding None/empty values."""
+        return {
+            name: value for name in AgentInstructions.__dataclass_fields__
+            if (value := getattr(self, name))
+        }
+
+
+class _ConfigurationSchema(BaseModel):
+    """
+    Pydantic schema backing Configuration.from_dict.
+
+    Coercion and range validation (int > 0, 0 <= temperature <= 2, lenient
+    bool/number parsing of JSON string values) happen in pydantic-core
+    instead of per-field Python isinstance cascades. Field names and
+    defaults mirror the persisted Configuration fields; unknown keys are
+    ignored like before.
+    """
+    model_config = ConfigDict(extra='ignore')
+
+    main_model: str = ''
+    cluster_model: str = ''
+    fallback_model: str = ''
+    default_output: str = 'docs'
+    cluster_base_url: Optional[str] = None
+    main_base_url: Optional[str] = None
+    fallback_base_url: Optional[str] = None
+    cluster_api_version: Optional[str] = None
+    main_api_version: Optional[str] = None
+    fallback_api_version: Optional[str] = None
+    cluster_max_tokens: int = Field(128000, gt=0)
+    main_max_tokens: int = Field(128000, gt=0)
+    fallback_max_tokens: int = Field(64000, gt=0)
+    cluster_temperature: float = Field(0.0, ge=0.0, le=2.0)
+    main_temperature: float = Field(0.0, ge=0.0, le=2.0)
+    fallback_temperature: float = Field(0.0, ge=0.0, le=2.0)
+    cluster_temperature_supported: bool = True
+    main_temperature_supported: bool = True
+    fallback_temperature_supported: bool = True
+    cluster_max_token_field: str = 'max_tokens'
+    main_max_token_field: str = 'max_tokens'
+    fallback_max_token_field: str = 'max_tokens'
+    max_token_per_module: int = Field(36369, gt=0)
+    max_token_per_leaf_module: int = Field(16000, gt=0)
+    max_depth: int = Field(2, gt=0)
+    has_cluster_key: bool = False
+    has_main_key: bool = False
+    has_fallback_key: bool = False
+
+
+@dataclass(slots=True)
 class Configuration:
     """
     CodeWiki configuration data model.
 
+    Slotted: a Configuration carries ~30 fields and several instances can be
+    alive at once (cached loads, per-job copies), so slot storage replaces a
+    per-instance __dict__ probe on every attribute read.
+
     Attributes:
         main_model: Primary model for documentation generation (generation phase)
         cluster_model: Model for module clustering
@@ -137,21 +236,24 @@ class Configuration:
         max_token_per_leaf_module: Maximum tokens per leaf module (default: 16000)
         max_depth: Maximum depth for hierarchical decomposition (default: 2)
         agent_instructions: Custom agent instructions for documentation generation
+        has_cluster_key: Whether a cluster API key was stored in the keyring
+        has_main_key: Whether a main API key was stored in the keyring
+        has_fallback_key: Whether a fallback API key was stored in the keyring
     """
     main_model: str
     cluster_model: str
     fallback_model: str
     # Runtime API keys (not persisted to config.json, fetched from keyring)
-    cluster_api_key: Optional[str] = None
-    main_api_key: Optional[str] = None
-    fallback_api_key: Optional[str] = None
+    cluster_api_key: Optional[str] = field(default=None, metadata={"exclude": True})
+    main_api_key: Optional[str] = field(default=None, metadata={"exclude": True})
+    fallback_api_key: Optional[str] = field(default=None, metadata={"exclude": True})
     default_output: str = "docs"
-    cluster_base_url: Optional[str] = None
-    main_base_url: Optional[str] = None
-    fallback_base_url: Optional[str] = None
-    cluster_api_version: Optional[str] = None
-    main_api_version: Optional[str] = None
-    fallback_api_version: Optional[str] = None
+    cluster_base_url: Optional[str] = field(default=None, metadata={"omit_if_none": True})
+    main_base_url: Optional[str] = field(default=None, metadata={"omit_if_none": True})
+    fallback_base_url: Optional[str] = field(default=None, metadata={"omit_if_none": True})
+    cluster_api_version: Optional[str] = field(default=None, metadata={"omit_if_none": True})
+    main_api_version: Optional[str] = field(default=None, metadata={"omit_if_none": True})
+    fallback_api_version: Optional[str] = field(default=None, metadata={"omit_if_none": True})
     cluster_max_tokens: int = 128000
     main_max_tokens: int = 128000
     fallback_max_tokens: int = 64000
@@ -168,7 +270,32 @@ class Configuration:
     max_token_per_leaf_module: int = 16000
     max_depth: int = 2
     agent_instructions: AgentInstructions = field(default_factory=AgentInstructions)
-    
+    # Non-sensitive fingerprint of keyring state: records that a key was
+    # successfully stored, so "is setup done?" checks can skip keyring IPC.
+    # The key itself still lives only in the keyring.
+    has_cluster_key: bool = False
+    has_main_key: bool = False
+    has_fallback_key: bool = False
+
+    # Model names and max-token field names are repeated across every
+    # Configuration instance (and almost always hold the same handful of
+    # literals, e.g. "max_tokens"). Interning them deduplicates the storage
+    # and lets downstream equality checks short-circuit on identity.
+    _INTERNED_FIELDS = (
+        'main_model',
+        'cluster_model',
+        'fallback_model',
+        'cluster_max_token_field',
+        'main_max_token_field',
+        'fallback_max_token_field',
+    )
+
+    def __post_init__(self):
+        for name in self._INTERNED_FIELDS:
+            value = getattr(self, name)
+            if isinstance(value, str):
+                setattr(self, name, sys.intern(value))
+
     def validate(self):
         """
         Validate all configuration fields.
@@ -190,45 +317,27 @@ class Configuration:
         validate_model_name(self.fallback_model)
     
     def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        result = {
-            'main_model': self.main_model,
-            'cluster_model': self.cluster_model,
-            'fallback_model': self.fallback_model,
-            'default_output': self.default_output,
-            'cluster_max_tokens': self.cluster_max_tokens,
-            'main_max_tokens': self.main_max_tokens,
-            'fallback_max_tokens': self.fallback_max_tokens,
-            'cluster_temperature': self.cluster_temperature,
-            'main_temperature': self.main_temperature,
-            'fallback_temperature': self.fallback_temperature,
-            'cluster_temperature_supported': self.cluster_temperature_supported,
-            'main_temperature_supported': self.main_temperature_supported,
-            'fallback_temperature_supported': self.fallback_temperature_supported,
-            'cluster_max_token_field': self.cluster_max_token_field,
-            'main_max_token_field': self.main_max_token_field,
-            'fallback_max_token_field': self.fallback_max_token_field,
-            'max_token_per_module': self.max_token_per_module,
-            'max_token_per_leaf_module': self.max_token_per_leaf_module,
-            'max_depth': self.max_depth,
-        }
-        # Per-provider base_urls (optional)
-        if self.cluster_base_url is not None:
-            result['cluster_base_url'] = self.cluster_base_url
-        if self.main_base_url is not None:
-            result['main_base_url'] = self.main_base_url
-        if self.fallback_base_url is not None:
-            result['fallback_base_url'] = self.fallback_base_url
-        # Per-provider api_versions (optional)
-        if self.cluster_api_version is not None:
-            result['cluster_api_version'] = self.cluster_api_version
-        if self.main_api_version is not None:
-            result['main_api_version'] = self.main_api_version
-        if self.fallback_api_version is not None:
-            result['fallback_api_version'] = self.fallback_api_version
-        # Agent instructions (optional)
-        if self.agent_instructions and not self.agent_instructions.is_empty():
-            result['agent_instructions'] = self.agent_instructions.to_dict()
+        """
+        Convert to dictionary.
+
+        Generated from the dataclass fields instead of a hand-maintained key
+        list: fields marked exclude (runtime API keys) are never emitted, and
+        fields marked omit_if_none are dropped when unset. New persisted
+        fields only need the right metadata on their field() declaration.
+        """
+        result = {}
+        for name, f in self.__dataclass_fields__.items():
+            metadata = f.metadata
+            if metadata.get('exclude'):
+                continue
+            value = getattr(self, name)
+            if name == 'agent_instructions':
+                if value and not value.is_empty():
+                    result[name] = value.to_dict()
+                continue
+            if value is None and metadata.get('omit_if_none'):
+                continue
+            result[name] = value
         return result
     
     @classmethod
@@ -244,105 +353,52 @@ class Configuration:
 
         Raises:
             ValueError: If type conversion fails or validation fails
+                (pydantic.ValidationError is a ValueError subclass)
         """
-        # Helper function for integer conversion
-        def to_int(value, field_name: str, default: int = None):
-            if value is None:
-                return default
-            if isinstance(value, int):
-                return value
-            if isinstance(value, str):
-                try:
-                    result = int(value)
-                    if result <= 0:
-                        raise ValueError(f"{field_name} must be positive, got {result}")
-                    return result
-                except ValueError as e:
-                    raise ValueError(f"Invalid {field_name}: {value} - {str(e)}")
-            raise ValueError(f"{field_name} must be integer, got {type(value).__name__}")
-
-        # Helper function for float conversion
-        def to_float(value, field_name: str, default: float = None, min_val: float = 0.0, max_val: float = 2.0):
-            if value is None:
-                return default
-            if isinstance(value, (int, float)):
-                result = float(value)
-            elif isinstance(value, str):
-                try:
-                    result = float(value)
-                except ValueError:
-                    raise ValueError(f"Invalid {field_name}: {value}")
-            else:
-                raise ValueError(f"{field_name} must be number, got {type(value).__name__}")
-
-            if not (min_val <= result <= max_val):
-                raise ValueError(f"{field_name} must be between {min_val} and {max_val}, got {result}")
-            return result
-
-        # Helper function for bool conversion
-        def to_bool(value, field_name: str, default: bool = True):
-            if value is None:
-                return default
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, str):
-                if value.lower() in ('true', '1', 'yes'):
-                    return True
-                if value.lower() in ('false', '0', 'no'):
-                    return False
-                raise ValueError(f"Invalid {field_name}: {value}")
-            raise ValueError(f"{field_name} must be boolean, got {type(value).__name__}")
-
         # Parse agent instructions
         agent_instructions = AgentInstructions()
         if 'agent_instructions' in data:
             agent_instructions = AgentInstructions.from_dict(data['agent_instructions'])
 
-        # Apply type conversions with validation
-        cluster_max_tokens = to_int(data.get('cluster_max_tokens'), 'cluster_max_tokens', 128000)
-        main_max_tokens = to_int(data.get('main_max_tokens'), 'main_max_tokens', 128000)
-        fallback_max_tokens = to_int(data.get('fallback_max_tokens'), 'fallback_max_tokens', 64000)
-        max_token_per_module = to_int(data.get('max_token_per_module'), 'max_token_per_module', 36369)
-        max_token_per_leaf_module = to_int(data.get('max_token_per_leaf_module'), 'max_token_per_leaf_module', 16000)
-        max_depth = to_int(data.get('max_depth'), 'max_depth', 2)
-
-        cluster_temperature = to_float(data.get('cluster_temperature'), 'cluster_temperature', 0.0)
-        main_temperature = to_float(data.get('main_temperature'), 'main_temperature', 0.0)
-        fallback_temperature = to_float(data.get('fallback_temperature'), 'fallback_temperature', 0.0)
-
-        cluster_temperature_supported = to_bool(data.get('cluster_temperature_supported'), 'cluster_temperature_supported', True)
-        main_temperature_supported = to_bool(data.get('main_temperature_supported'), 'main_temperature_supported', True)
-        fallback_temperature_supported = to_bool(data.get('fallback_temperature_supported'), 'fallback_temperature_supported', True)
-
-        return cls(
-            main_model=data.get('main_model', ''),
-            cluster_model=data.get('cluster_model', ''),
-            fallback_model=data.get('fallback_model', ''),
-            default_output=data.get('default_output', 'docs'),
-            cluster_base_url=data.get('cluster_base_url'),
-            main_base_url=data.get('main_base_url'),
-            fallback_base_url=data.get('fallback_base_url'),
-            cluster_api_version=data.get('cluster_api_version'),
-            main_api_version=data.get('main_api_version'),
-            fallback_api_version=data.get('fallback_api_version'),
-            cluster_max_tokens=cluster_max_tokens,
-            main_max_tokens=main_max_tokens,
-            fallback_max_tokens=fallback_max_tokens,
-            cluster_temperature=cluster_temperature,
-            main_temperature=main_temperature,
-            fallback_temperature=fallback_temperature,
-            cluster_temperature_supported=cluster_temperature_supported,
-            main_temperature_supported=main_temperature_supported,
-            fallback_temperature_supported=fallback_temperature_supported,
-            cluster_max_token_field=data.get('cluster_max_token_field', 'max_tokens'),
-            main_max_token_field=data.get('main_max_token_field', 'max_tokens'),
-            fallback_max_token_field=data.get('fallback_max_token_field', 'max_tokens'),
-            max_token_per_module=max_token_per_module,
-            max_token_per_leaf_module=max_token_per_leaf_module,
-            max_depth=max_depth,
-            agent_instructions=agent_instructions,
+        # Coercion and validation run in pydantic-core; explicit JSON nulls
+        # are stripped first so they fall back to the schema defaults, as
+        # the old hand-rolled converters did
+        parsed = _ConfigurationSchema.model_validate(
+            {key: value for key, value in data.items() if value is not None}
         )
+        return cls(agent_instructions=agent_instructions, **parsed.model_dump())
     
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _load_cached(path: str, mtime_ns: int, size: int) -> 'Configuration':
+        """Parse and coerce a config file once per (path, mtime, size)."""
+        from codewiki.cli.utils.fs import safe_read
+        data = json.loads(safe_read(Path(path)))
+        return Configuration.from_dict(data)
+
+    @classmethod
+    def load_cached(cls, path: Union[str, Path]) -> 'Configuration':
+        """
+        Load a Configuration from a JSON file with process-level caching.
+
+        Repeated loads of an unchanged file skip JSON decoding and all
+        from_dict type coercion; staleness is detected with a single stat()
+        per call. A shallow copy is returned so callers cannot mutate the
+        cached instance.
+
+        Args:
+            path: Path to the configuration JSON file
+
+        Returns:
+            Configuration instance
+
+        Raises:
+            OSError: If the file cannot be stat'd/read
+        """
+        st = os.stat(path)
+        cached = cls._load_cached(str(path), st.st_mtime_ns, st.st_size)
+        return replace(cached)
+
     def is_complete(self) -> bool:
         """Check if all required fields are set."""
         return bool(
@@ -373,12 +429,19 @@ class Configuration:
             If API keys are not provided as arguments, they will be fetched from the system keyring
             using the ConfigManager.
         """
-        from codewiki.src.config import Config
+        Config = _backend_config_cls()
+
+        # Prefer keys passed by the caller, then runtime keys already cached
+        # on this Configuration (e.g., populated by the generate command)
+        cluster_api_key = cluster_api_key or self.cluster_api_key
+        main_api_key = main_api_key or self.main_api_key
+        fallback_api_key = fallback_api_key or self.fallback_api_key
 
-        # Fetch API keys from keyring if not provided
+        # Only touch the keyring for keys that are still missing; the shared
+        # manager caches them so the IPC cost is paid at most once per process
         if cluster_api_key is None or main_api_key is None or fallback_api_key is None:
-            from codewiki.cli.config_manager import ConfigManager
-            config_manager = ConfigManager()
+            from codewiki.cli.config_manager import get_default_manager
+            config_manager = get_default_manager()
             if cluster_api_key is None:
                 cluster_api_key = config_manager.get_cluster_api_key()
             if main_api_key is None:
@@ -387,16 +450,11 @@ class Configuration:
                 fallback_api_key = config_manager.get_fallback_api_key()
 
         # Merge runtime instructions with persistent settings
-        # Runtime instructions take precedence
+        # Runtime instructions take precedence; the overlay reads through
+        # without allocating a merged AgentInstructions
         final_instructions = self.agent_instructions
         if runtime_instructions and not runtime_instructions.is_empty():
-            final_instructions = AgentInstructions(
-                include_patterns=runtime_instructions.include_patterns or self.agent_instructions.include_patterns,
-                exclude_patterns=runtime_instructions.exclude_patterns or self.agent_instructions.exclude_patterns,
-                focus_modules=runtime_instructions.focus_modules or self.agent_instructions.focus_modules,
-                doc_type=runtime_instructions.doc_type or self.agent_instructions.doc_type,
-                custom_instructions=runtime_instructions.custom_instructions or self.agent_instructions.custom_instructions,
-            )
+            final_instructions = _MergedInstructions(runtime_instructions, self.agent_instructions)
 
         return Config.from_cli(
             repo_path=repo_path,
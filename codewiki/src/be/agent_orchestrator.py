@@ -1,9 +1,9 @@
 from pydantic_ai import Agent
 from pydantic_ai.usage import UsageLimits
 # import logfire
+import asyncio
 import logging
 import os
-import traceback
 from typing import Dict, List, Any
 
 # Configure logging and monitoring
@@ -56,6 +56,10 @@ from codewiki.src.config import (
 from codewiki.src.utils import file_manager
 from codewiki.src.be.dependency_analyzer.models.core import Node
 
+# Default number of modules processed concurrently by process_modules();
+# a `max_concurrent_modules` attribute on the config overrides it when set
+DEFAULT_MODULE_CONCURRENCY = 4
+
 
 class AgentOrchestrator:
     """Orchestrates the AI agents for documentation generation."""
@@ -67,6 +71,26 @@ class AgentOrchestrator:
         self.config = config
         self.fallback_models = create_fallback_models(config)
         self.custom_instructions = config.get_prompt_addition() if config else None
+        # Resolved once; process_module runs per module and should not redo
+        # the abspath work every call
+        self._base_docs_dir = os.path.abspath(config.docs_dir) if config else None
+        self._abs_repo_path = str(os.path.abspath(config.repo_path)) if config else None
+        # Tool lists are identical for every agent of a complexity class;
+        # build them once instead of per create_agent call
+        self._complex_tools = [
+            read_code_components_tool,
+            str_replace_editor_tool,
+            generate_sub_module_documentation_tool,
+        ]
+        self._leaf_tools = [read_code_components_tool, str_replace_editor_tool]
+        # In-memory module tree cache; validated against file mtime so an
+        # external rewrite is still picked up, but the per-module reload of
+        # the same growing JSON file is gone
+        self._module_tree: Dict[str, Any] = None
+        self._module_tree_mtime: int = None
+        # Serializes module tree load/save when modules are processed
+        # concurrently via process_modules()
+        self._module_tree_lock = asyncio.Lock()
 
         # Log custom instructions status for debugging
         if self.custom_instructions:
@@ -75,21 +99,45 @@ class AgentOrchestrator:
             logger.info(f"   └─ Preview: {self.custom_instructions[:100]}...")
         else:
             logger.info("🔧 AgentOrchestrator initialized without custom instructions")
-    
+
+    def _load_module_tree(self, module_tree_path: str) -> Dict[str, Any]:
+        """Load the module tree, reusing the cached copy while the file is unchanged."""
+        try:
+            mtime = os.stat(module_tree_path).st_mtime_ns
+        except OSError:
+            self._module_tree = None
+            self._module_tree_mtime = None
+            return None
+
+        if self._module_tree is None or mtime != self._module_tree_mtime:
+            self._module_tree = file_manager.load_json(module_tree_path)
+            self._module_tree_mtime = mtime
+        return self._module_tree
+
+    def _save_module_tree(self, module_tree: Dict[str, Any], module_tree_path: str):
+        """Write the module tree through to disk and refresh the cache."""
+        file_manager.save_json(module_tree, module_tree_path)
+        self._module_tree = module_tree
+        try:
+            self._module_tree_mtime = os.stat(module_tree_path).st_mtime_ns
+        except OSError:
+            self._module_tree_mtime = None
+
+
     def create_agent(self, module_name: str, components: Dict[str, Any],
-                    core_component_ids: List[str]) -> Agent:
+                    core_component_ids: List[str], is_complex: bool = None) -> Agent:
         """Create an appropriate agent based on module complexity."""
+        # Callers that already know the complexity pass it in; recompute only
+        # when it wasn't provided
+        if is_complex is None:
+            is_complex = is_complex_module(components, core_component_ids)
         # FLAMINGO_PATCH: Added retries=3 to fix "Tool exceeded max retries count of 1" errors
-        if is_complex_module(components, core_component_ids):
+        if is_complex:
             return Agent(
                 self.fallback_models,
                 name=module_name,
                 deps_type=CodeWikiDeps,
-                tools=[
-                    read_code_components_tool,
-                    str_replace_editor_tool,
-                    generate_sub_module_documentation_tool
-                ],
+                tools=self._complex_tools,
                 system_prompt=format_system_prompt(module_name, self.custom_instructions),
                 retries=3,  # From fork
             )
@@ -98,7 +146,7 @@ class AgentOrchestrator:
                 self.fallback_models,
                 name=module_name,
                 deps_type=CodeWikiDeps,
-                tools=[read_code_components_tool, str_replace_editor_tool],
+                tools=self._leaf_tools,
                 system_prompt=format_leaf_system_prompt(module_name, self.custom_instructions),
                 retries=3,  # From fork
             )
@@ -117,20 +165,20 @@ class AgentOrchestrator:
         # Load or create module tree
         # CRITICAL: module_tree.json is ALWAYS in the BASE docs directory,
         # not in the module's subdirectory (working_dir may be a nested path)
-        base_docs_dir = os.path.abspath(self.config.docs_dir)
-        module_tree_path = os.path.join(base_docs_dir, MODULE_TREE_FILENAME)
-        module_tree = file_manager.load_json(module_tree_path)
+        module_tree_path = os.path.join(self._base_docs_dir, MODULE_TREE_FILENAME)
+        async with self._module_tree_lock:
+            module_tree = self._load_module_tree(module_tree_path)
         
         # Create agent
         is_complex = is_complex_module(components, core_component_ids)
         agent_type = "Complex (with sub-modules)" if is_complex else "Leaf (single module)"
         logger.info(f"   └─ Agent type: {agent_type}")
-        agent = self.create_agent(module_name, components, core_component_ids)
+        agent = self.create_agent(module_name, components, core_component_ids, is_complex)
 
         # Create dependencies
         deps = CodeWikiDeps(
             absolute_docs_path=working_dir,
-            absolute_repo_path=str(os.path.abspath(self.config.repo_path)),
+            absolute_repo_path=self._abs_repo_path,
             registry={},
             components=components,
             path_to_current_module=module_path,
@@ -142,10 +190,17 @@ class AgentOrchestrator:
             custom_instructions=self.custom_instructions
         )
 
+        # Check for already-generated docs with a single directory scan
+        # instead of one stat call per candidate file; this is the hot path
+        # when resuming a partially completed run
+        try:
+            existing_files = {entry.name for entry in os.scandir(working_dir)}
+        except FileNotFoundError:
+            existing_files = set()
+
         # check if overview docs already exists
-        overview_docs_path = os.path.join(working_dir, OVERVIEW_FILENAME)
-        if os.path.exists(overview_docs_path):
-            logger.info(f"✓ Overview docs already exists at {overview_docs_path}")
+        if OVERVIEW_FILENAME in existing_files:
+            logger.info(f"✓ Overview docs already exists at {os.path.join(working_dir, OVERVIEW_FILENAME)}")
             return module_tree
 
         # check if module docs already exists
@@ -153,7 +208,7 @@ class AgentOrchestrator:
         # e.g., working_dir = "docs/architecture/api_service_core"
         # File should be at: "docs/architecture/api_service_core/api_service_core.md"
         docs_path = os.path.join(working_dir, f"{module_name}.md")
-        if os.path.exists(docs_path):
+        if f"{module_name}.md" in existing_files:
             logger.info(f"✓ Module docs already exists at {docs_path}")
             return module_tree
         
@@ -185,7 +240,8 @@ class AgentOrchestrator:
             )
 
             # Save updated module tree
-            file_manager.save_json(deps.module_tree, module_tree_path)
+            async with self._module_tree_lock:
+                self._save_module_tree(deps.module_tree, module_tree_path)
             logger.info(f"✅ Successfully generated documentation for: {module_name}")
             logger.info(f"   └─ Output: {docs_path}")
 
@@ -204,7 +260,45 @@ class AgentOrchestrator:
 
             return deps.module_tree
 
-        except Exception as e:
-            logger.error(f"❌ Error processing module {module_name}: {str(e)}")
-            logger.error(f"   └─ Traceback: {traceback.format_exc()}")
-            raise
\ No newline at end of file
+        except Exception:
+            # exc_info defers traceback formatting to the handler, so the
+            # frame walk only happens when a handler actually emits at ERROR
+            logger.error("❌ Error processing module %s", module_name, exc_info=True)
+            raise
+
+    async def process_modules(self, modules: List[tuple]) -> Dict[str, Any]:
+        """Process a batch of independent modules concurrently.
+
+        Each entry in ``modules`` is a tuple of process_module() arguments:
+        (module_name, components, core_component_ids, module_path, working_dir).
+        Modules run as coroutines under asyncio.gather, throttled by a
+        semaphore (``config.max_concurrent_modules`` when set, otherwise
+        DEFAULT_MODULE_CONCURRENCY). Each call builds its own CodeWikiDeps
+        and working_dir is already per-module, so workers only share the
+        module tree cache, which is guarded by an asyncio.Lock.
+
+        A failed module is logged and skipped so the rest of the batch
+        still completes, matching the graceful degradation of the serial
+        processing loop. Returns the module tree after the last successful
+        module.
+        """
+        concurrency = getattr(self.config, "max_concurrent_modules", None) or DEFAULT_MODULE_CONCURRENCY
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def process_one(args):
+            async with semaphore:
+                return await self.process_module(*args)
+
+        logger.info(f"📝 Processing {len(modules)} modules (concurrency: {concurrency})")
+        results = await asyncio.gather(
+            *(process_one(args) for args in modules),
+            return_exceptions=True,
+        )
+
+        module_tree = None
+        for (module_name, *_), result in zip(modules, results):
+            if isinstance(result, BaseException):
+                logger.error(f"❌ Module {module_name} failed: {result}")
+            else:
+                module_tree = result
+        return module_tree if module_tree is not None else self._module_tree
\ No newline at end of file
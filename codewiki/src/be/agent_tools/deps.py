@@ -14,4 +14,9 @@ class CodeWikiDeps:
     max_depth: int
     current_depth: int
     config: Config  # LLM configuration
-    custom_instructions: str = None
\ No newline at end of file
+    custom_instructions: str = None
+    # Children dict of the current module's node inside module_tree.
+    # Cached so tools insert sub-modules directly instead of walking
+    # path_to_current_module from the root on every call; None means
+    # "resolve from module_tree" (top-level agents).
+    current_module_children: dict = None
\ No newline at end of file
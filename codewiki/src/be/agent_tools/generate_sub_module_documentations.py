@@ -1,3 +1,6 @@
+import asyncio
+from dataclasses import replace
+
 from pydantic_ai import RunContext, Tool, Agent
 from pydantic_ai.usage import UsageLimits
 
@@ -6,13 +9,64 @@ from codewiki.src.be.agent_tools.read_code_components import read_code_component
 from codewiki.src.be.agent_tools.str_replace_editor import str_replace_editor_tool
 from codewiki.src.be.llm_services import create_fallback_models
 from codewiki.src.be.prompt_template import SYSTEM_PROMPT, LEAF_SYSTEM_PROMPT, format_user_prompt, format_system_prompt, format_leaf_system_prompt
-from codewiki.src.be.utils import is_complex_module, count_tokens
-from codewiki.src.be.cluster_modules import format_potential_core_components
+from codewiki.src.be.utils import is_complex_module
+from codewiki.src.be.cluster_modules import create_component_id_map, estimate_components_tokens
 
 import logging
 logger = logging.getLogger(__name__)
 
 
+# Agent construction re-initializes model clients, tool schemas and
+# validators, and the old code paid that per sibling. Siblings only differ
+# in name and system prompt, so two shared Agents per config (complex and
+# leaf) with a dynamic system prompt that reads the module name off deps
+# replace per-sibling construction. Fallback model chains are likewise
+# built once per config object. Both are stashed on the Config instance
+# itself rather than in a module-level id()-keyed dict: in the long-lived
+# worker process an id() key can be recycled after the config is
+# collected, handing a later job the previous job's agents and model
+# chain, and entries would otherwise accumulate per job forever. (Config
+# is a dataclass with eq=True, hence unhashable — a WeakKeyDictionary
+# isn't an option.)
+
+
+def _fallback_models(config) -> object:
+    models = getattr(config, '_sub_agent_fallback_models', None)
+    if models is None:
+        models = create_fallback_models(config)
+        config._sub_agent_fallback_models = models
+    return models
+
+
+def _shared_sub_agent(config, is_complex: bool) -> Agent:
+    agents = getattr(config, '_sub_agent_cache', None)
+    if agents is None:
+        agents = {}
+        config._sub_agent_cache = agents
+    agent = agents.get(is_complex)
+    if agent is None:
+        # FLAMINGO_PATCH: Added retries=3 to fix "Tool exceeded max retries count of 1" errors
+        if is_complex:
+            tools = [read_code_components_tool, str_replace_editor_tool, generate_sub_module_documentation_tool]
+        else:
+            tools = [read_code_components_tool, str_replace_editor_tool]
+        agent = Agent(
+            model=_fallback_models(config),
+            name="sub-module-agent" if is_complex else "leaf-module-agent",
+            deps_type=CodeWikiDeps,
+            tools=tools,
+            retries=3,
+        )
+
+        @agent.system_prompt
+        def _module_system_prompt(ctx: RunContext[CodeWikiDeps]) -> str:
+            if is_complex:
+                return format_system_prompt(ctx.deps.current_module_name, ctx.deps.custom_instructions)
+            return format_leaf_system_prompt(ctx.deps.current_module_name, ctx.deps.custom_instructions)
+
+        agents[is_complex] = agent
+    return agent
+
 
 async def generate_sub_module_documentation(
     ctx: RunContext[CodeWikiDeps],
@@ -25,25 +79,25 @@ async def generate_sub_module_documentation(
     """
 
     deps = ctx.deps
-    previous_module_name = deps.current_module_name
 
     # CRITICAL FIX: Use ID-based normalization system
     # The LLM returns integer IDs (e.g., 0, 1, 2) which we need to convert to FQDNs
     logger.info(f"🔄 Normalizing sub-module component IDs (ID-based system)")
 
-    # Get all component IDs from sub_module_specs to create ID mapping
-    all_component_ids = []
-    for component_ids in sub_module_specs.values():
-        all_component_ids.extend(component_ids)
-
-    # Create ID-to-FQDN mapping using the ID-based system
-    # This returns (str1, str2, id_to_fqdn, id_descriptions) but we only need id_to_fqdn
-    _, _, id_to_fqdn, _ = format_potential_core_components(all_component_ids, deps.components)
+    # Create ID-to-FQDN mapping using the ID-based system. The map covers
+    # the full components dict (IDs are global) and is cached per run, so
+    # there is no need to assemble the prompt-formatting strings here.
+    id_to_fqdn, _ = create_component_id_map(deps.components)
 
     normalized_specs = {}
     total_normalized = 0
     total_failed = 0
 
+    # Lowercased FQDNs for the "similar components" hint on normalization
+    # failures, built lazily and at most once: lowercasing every FQDN inside
+    # the failure handler scaled as O(failures x components)
+    lower_fqdns = None
+
     for sub_module_name, component_ids in sub_module_specs.items():
         normalized_ids = []
         for comp_id in component_ids:
@@ -69,7 +123,10 @@ async def generate_sub_module_documentation(
                         total_failed += 1
                 except (ValueError, TypeError):
                     # comp_id is not an integer - likely a class name (LLM ignored instructions)
-                    similar_fqdns = [fqdn for fqdn in deps.components.keys() if str(comp_id).lower() in fqdn.lower()][:5]
+                    if lower_fqdns is None:
+                        lower_fqdns = [(fqdn, fqdn.lower()) for fqdn in deps.components]
+                    comp_id_lower = str(comp_id).lower()
+                    similar_fqdns = [fqdn for fqdn, lowered in lower_fqdns if comp_id_lower in lowered][:5]
                     logger.warning(
                         f"   ⚠️  Failed to normalize '{comp_id}' in sub-module '{sub_module_name}'\n"
                         f"      ├─ Not an integer ID (type: {type(comp_id).__name__})\n"
@@ -88,80 +145,158 @@ async def generate_sub_module_documentation(
     # Replace original specs with normalized specs
     sub_module_specs = normalized_specs
 
-    # Create fallback models from config
-    fallback_models = create_fallback_models(deps.config)
-
-    # add the sub-module to the module tree
-    value = deps.module_tree
-    for key in deps.path_to_current_module:
-        # Ensure the key exists and has a children dict
-        if key not in value:
-            logger.warning(f"Module '{key}' not found in tree, creating empty entry")
-            value[key] = {"children": {}}
-        if "children" not in value[key]:
-            logger.warning(f"Module '{key}' missing 'children' key, adding empty dict")
-            value[key]["children"] = {}
-        value = value[key]["children"]
+    # add the sub-module to the module tree; the insertion point is cached
+    # on deps so nested agents don't re-walk the tree from the root on
+    # every call (the walk only runs for top-level agents, once)
+    value = deps.current_module_children
+    if value is None:
+        value = deps.module_tree
+        for key in deps.path_to_current_module:
+            # Ensure the key exists and has a children dict
+            if key not in value:
+                logger.warning(f"Module '{key}' not found in tree, creating empty entry")
+                value[key] = {"children": {}}
+            if "children" not in value[key]:
+                logger.warning(f"Module '{key}' missing 'children' key, adding empty dict")
+                value[key]["children"] = {}
+            value = value[key]["children"]
     for sub_module_name, core_component_ids in sub_module_specs.items():
         value[sub_module_name] = {"components": core_component_ids, "children": {}}
-    
-    for sub_module_name, core_component_ids in sub_module_specs.items():
 
+    # Decide complex vs leaf with the cheap predicates first: when the
+    # depth cap or the single-file check already forces the leaf path,
+    # formatting and tokenizing the full component payload just to compare
+    # against the threshold is wasted work.
+    max_leaf_tokens = deps.config.max_token_per_leaf_module
+    may_recurse = deps.current_depth < deps.max_depth
+    sizes: dict[str, int] = {}
+
+    def _size(sub_module_name: str) -> int:
+        if sub_module_name not in sizes:
+            # Sum of per-FQDN cached token counts — no payload string is
+            # built, and components shared between siblings are only
+            # tokenized once
+            sizes[sub_module_name] = estimate_components_tokens(
+                sub_module_specs[sub_module_name], deps.components)
+        return sizes[sub_module_name]
+
+    complex_modules = {
+        sub_module_name
+        for sub_module_name, core_component_ids in sub_module_specs.items()
+        if may_recurse
+        and is_complex_module(deps.components, core_component_ids)
+        and _size(sub_module_name) >= max_leaf_tokens
+    }
+
+    async def _run_one(sub_module_name: str, core_component_ids: list[str]) -> None:
+        """Run one sibling sub-module agent with its own deps view."""
         # Create visual indentation for nested modules
         indent = "  " * deps.current_depth
         arrow = "└─" if deps.current_depth > 0 else "→"
 
         logger.info(f"{indent}{arrow} Generating documentation for sub-module: {sub_module_name}")
 
-        # Get the second element (potential_core_components_with_code) which is a string
-        _, potential_core_components_with_code, _, _ = format_potential_core_components(core_component_ids, ctx.deps.components)
-        num_tokens = count_tokens(potential_core_components_with_code)
-
-        # FLAMINGO_PATCH: Added retries=3 to fix "Tool exceeded max retries count of 1" errors
-        # Use configurable max_token_per_leaf_module instead of hardcoded constant
-        if is_complex_module(ctx.deps.components, core_component_ids) and ctx.deps.current_depth < ctx.deps.max_depth and num_tokens >= ctx.deps.config.max_token_per_leaf_module:
-            sub_agent = Agent(
-                model=fallback_models,
-                name=sub_module_name,
-                deps_type=CodeWikiDeps,
-                system_prompt=format_system_prompt(sub_module_name, ctx.deps.custom_instructions),
-                tools=[read_code_components_tool, str_replace_editor_tool, generate_sub_module_documentation_tool],
-                retries=3,
-            )
-        else:
-            sub_agent = Agent(
-                model=fallback_models,
-                name=sub_module_name,
-                deps_type=CodeWikiDeps,
-                system_prompt=format_leaf_system_prompt(sub_module_name, ctx.deps.custom_instructions),
-                tools=[read_code_components_tool, str_replace_editor_tool],
-                retries=3,
-            )
-
-        deps.current_module_name = sub_module_name
-        deps.path_to_current_module.append(sub_module_name)
-        deps.current_depth += 1
-        # log the current module tree
-        # print(f"Current module tree: {json.dumps(deps.module_tree, indent=4)}")
+        # Shared per-config Agent; the dynamic system prompt picks up the
+        # module name from sub_deps at run time
+        sub_agent = _shared_sub_agent(deps.config, sub_module_name in complex_modules)
+
+        # Each sibling gets a shallow-copied deps with its own module name,
+        # path and depth; the module tree, registry and components stay
+        # shared. This replaces the old mutate-then-restore dance on the
+        # parent deps, which would race once siblings run concurrently.
+        sub_deps = replace(
+            deps,
+            current_module_name=sub_module_name,
+            path_to_current_module=deps.path_to_current_module + [sub_module_name],
+            current_depth=deps.current_depth + 1,
+            current_module_children=value[sub_module_name]["children"],
+        )
 
         # FLAMINGO_PATCH: Added usage_limits to prevent "request_limit of 50" exceeded errors
-        result = await sub_agent.run(
+        await sub_agent.run(
             format_user_prompt(
-                module_name=deps.current_module_name,
+                module_name=sub_module_name,
                 core_component_ids=core_component_ids,
-                components=ctx.deps.components,
-                module_tree=ctx.deps.module_tree,
+                components=deps.components,
+                module_tree=deps.module_tree,
             ),
-            deps=ctx.deps,
+            deps=sub_deps,
             usage_limits=UsageLimits(request_limit=1000),
         )
 
-        # remove the sub-module name from the path to current module and the module tree
-        deps.path_to_current_module.pop()
-        deps.current_depth -= 1
+    async def _run_batch(batch: list[str]) -> None:
+        """Document several small sibling leaf modules in one agent session."""
+        batch_label = ", ".join(batch)
+        indent = "  " * deps.current_depth
+        arrow = "└─" if deps.current_depth > 0 else "→"
+        logger.info(f"{indent}{arrow} Generating documentation for batched sub-modules: {batch_label}")
+
+        # Shared leaf Agent; sub_deps carries the batch label as the
+        # current module name for the dynamic system prompt
+        sub_agent = _shared_sub_agent(deps.config, False)
+
+        sections = []
+        for sub_module_name in batch:
+            section = format_user_prompt(
+                module_name=sub_module_name,
+                core_component_ids=sub_module_specs[sub_module_name],
+                components=deps.components,
+                module_tree=deps.module_tree,
+            )
+            sections.append(f'<MODULE name="{sub_module_name}">\n{section}\n</MODULE>')
+
+        batched_prompt = (
+            "The following independent sibling modules are small enough to be "
+            "documented in one session. Treat each <MODULE> block below as a "
+            "separate documentation task: follow its instructions in full and "
+            "save that module's documentation to its own <module_name>.md file "
+            "before moving on to the next module.\n\n"
+            + "\n\n".join(sections)
+        )
+
+        sub_deps = replace(
+            deps,
+            current_module_name=batch_label,
+            current_depth=deps.current_depth + 1,
+        )
 
-    # restore the previous module name
-    deps.current_module_name = previous_module_name
+        await sub_agent.run(
+            batched_prompt,
+            deps=sub_deps,
+            usage_limits=UsageLimits(request_limit=1000),
+        )
+
+    # Split siblings into bins: modules that take the complex path run
+    # alone; small leaf siblings are greedily first-fit packed so one agent
+    # call documents several of them, trading N network round-trips for
+    # ~N/b. Packing needs token sizes, so batchable siblings are sized here
+    # — unless there is at most one, in which case no packing decision
+    # exists and the formatter pass is skipped entirely.
+    batchable = [name for name in sub_module_specs if name not in complex_modules]
+    bins: list[list[str]] = []
+    if len(batchable) <= 1:
+        bins = [[name] for name in batchable]
+    else:
+        bin_tokens: list[int] = []
+        for name in sorted(batchable, key=_size, reverse=True):
+            for i, total in enumerate(bin_tokens):
+                if total + sizes[name] <= max_leaf_tokens:
+                    bins[i].append(name)
+                    bin_tokens[i] += sizes[name]
+                    break
+            else:
+                bins.append([name])
+                bin_tokens.append(sizes[name])
+
+    # Sibling sub-modules are independent: run the bins concurrently so the
+    # wall-clock cost is the slowest bin, not the sum of all of them
+    tasks = [_run_one(name, sub_module_specs[name]) for name in complex_modules]
+    for batch in bins:
+        if len(batch) == 1:
+            tasks.append(_run_one(batch[0], sub_module_specs[batch[0]]))
+        else:
+            tasks.append(_run_batch(batch))
+    await asyncio.gather(*tasks)
 
     return f"Generate successfully. Documentations: {', '.join([key + '.md' for key in sub_module_specs.keys()])} are saved in the working directory."
 
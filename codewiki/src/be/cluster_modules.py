@@ -1,17 +1,47 @@
 from typing import List, Dict, Any, Optional
-from collections import defaultdict
+from collections import OrderedDict
+import ast
+import asyncio
+import hashlib
+import json
 import logging
+import re
 import traceback
+
+# orjson parses large JSON payloads several times faster than stdlib json;
+# fall back silently when it isn't installed (optional dependency, same
+# pattern as FileManager)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 from codewiki.src.be.dependency_analyzer.models.core import Node
 from codewiki.src.be.dependency_analyzer.validation import validate_components_before_clustering
 from codewiki.src.be.llm_services import call_llm
-from codewiki.src.be.utils import count_tokens
+from codewiki.src.be.utils import count_tokens_many
 from codewiki.src.config import Config
 from codewiki.src.be.prompt_template import format_cluster_prompt
 
 
+# Precompiled hint patterns: one C-level scan per FQDN instead of
+# per-substring Python loops in the hot create_component_id_map path
+_SERVICE_PART_RE = re.compile(r'[^.]*(?:-service|-api)[^.]*')
+# Lookahead so overlapping names (e.g. "handlerepository") are all reported
+_PACKAGE_RE = re.compile(
+    r'(?=(controller|service|repository|model|dto|config|util|helper|handler|processor))'
+)
+# Priority order preserved from the original list-based scan
+_COMMON_PACKAGES = ('controller', 'service', 'repository', 'model', 'dto',
+                    'config', 'util', 'helper', 'handler', 'processor')
+
+# Single-pass extraction of the clustering payload; the split-based parser
+# copied the (potentially multi-MB) response twice
+_GROUPED_COMPONENTS_RE = re.compile(r'<GROUPED_COMPONENTS>(.*?)</GROUPED_COMPONENTS>', re.DOTALL)
+
+
 def extract_module_hint(fqdn: str) -> str:
     """
     Extract module name from FQDN for human readability.
@@ -20,14 +50,13 @@ def extract_module_hint(fqdn: str) -> str:
         "openframe-oss-lib.openframe-api-service-core..." → "api-service"
         "main-repo.src/services/auth.py::AuthService" → "auth"
     """
-    # Strategy 1: Look for service-like patterns (openframe-api-service → api-service)
-    parts = fqdn.split('.')
-    for part in parts:
-        if '-service' in part or '-api' in part:
-            # Extract meaningful part (e.g., "openframe-api-service" → "api-service")
-            segments = part.split('-')
-            if len(segments) >= 2:
-                return '-'.join(segments[-2:])
+    # Strategy 1: Look for service-like patterns (openframe-api-service → api-service);
+    # the regex finds the first dot-separated part containing -service/-api
+    match = _SERVICE_PART_RE.search(fqdn)
+    if match:
+        segments = match.group().split('-')
+        if len(segments) >= 2:
+            return '-'.join(segments[-2:])
 
     # Strategy 2: Extract from file path (src/services/auth.py → auth)
     if '::' in fqdn:
@@ -39,7 +68,8 @@ def extract_module_hint(fqdn: str) -> str:
                 return part.replace('.py', '').replace('.java', '').replace('.ts', '')
 
     # Fallback: Use first segment
-    return parts[0] if parts else "unknown"
+    first_segment = fqdn.partition('.')[0]
+    return first_segment if first_segment else "unknown"
 
 
 def extract_package_hint(fqdn: str) -> str:
@@ -50,14 +80,14 @@ def extract_package_hint(fqdn: str) -> str:
         "...src.main.java.com.openframe.api.controller.Class" → "controller"
         "main-repo.src/models/device.py::DeviceModel" → "models"
     """
-    # Strategy 1: Look for common package patterns
-    common_packages = ['controller', 'service', 'repository', 'model', 'dto',
-                      'config', 'util', 'helper', 'handler', 'processor']
-
-    fqdn_lower = fqdn.lower()
-    for pkg in common_packages:
-        if pkg in fqdn_lower:
-            return pkg
+    # Strategy 1: Look for common package patterns. One regex pass collects
+    # every known package name present; the priority order of the original
+    # per-package substring loop is preserved via _COMMON_PACKAGES.
+    found = set(_PACKAGE_RE.findall(fqdn.lower()))
+    if found:
+        for pkg in _COMMON_PACKAGES:
+            if pkg in found:
+                return pkg
 
     # Strategy 2: Extract from file path structure
     if '::' in fqdn:
@@ -76,43 +106,154 @@ def extract_package_hint(fqdn: str) -> str:
     return "core"
 
 
+# Caches of data derived from the components dict of the current run. The
+# dict is built once per run and never mutated afterwards, so object
+# identity is a stable key — but only while the object is alive: id()
+# values are recycled after GC, and the background worker keeps one
+# process alive across many jobs, so a bare id() key could silently serve
+# one job's maps to the next. Holding the dict itself and comparing with
+# `is` makes the check immune to address reuse, and keeping only the
+# current run's entry stops derived data from accumulating across jobs.
+_CACHE_OWNER: Optional[Dict[str, Node]] = None
+_ID_MAP_CACHE: Optional[tuple[Dict[int, str], Dict[str, str], Dict[str, int]]] = None
+
+
+def _scope_caches_to(components: Dict[str, Node]) -> None:
+    """Reset derived caches when a different components dict is observed."""
+    global _CACHE_OWNER, _ID_MAP_CACHE, _SORT_RANK_CACHE
+    if _CACHE_OWNER is not components:
+        _CACHE_OWNER = components
+        _ID_MAP_CACHE = None
+        _SORT_RANK_CACHE = None
+        _SRC_BLOCK_CACHE.clear()
+        _SRC_TOKEN_CACHE.clear()
+
+
+def _component_id_maps(components: Dict[str, Node]) -> tuple[Dict[int, str], Dict[str, str], Dict[str, int]]:
+    """Return (id_to_fqdn, id_descriptions, fqdn_to_id), cached for the current components dict."""
+    global _ID_MAP_CACHE
+    _scope_caches_to(components)
+    cached = _ID_MAP_CACHE
+    if cached is None:
+        id_to_fqdn = {}
+        id_descriptions = {}
+
+        logger.info("🔢 Creating component ID mapping")
+
+        for idx, (fqdn, component_data) in enumerate(sorted(components.items())):
+            id_to_fqdn[idx] = fqdn
+
+            # Extract human-readable parts (rpartition: no list allocation,
+            # and the whole string falls through when the separator is absent)
+            class_name = fqdn.rpartition('::' if '::' in fqdn else '.')[2]
+
+            module_hint = extract_module_hint(fqdn)
+            package_hint = extract_package_hint(fqdn)
+
+            # Create concise description
+            id_descriptions[str(idx)] = f"{class_name} ({module_hint}, {package_hint})"
+
+        logger.info(f"   ✅ Created {len(id_to_fqdn)} component ID mappings")
+        logger.debug(f"   Example: 0 → {id_descriptions.get('0', 'N/A')}")
+
+        fqdn_to_id = {fqdn: idx for idx, fqdn in id_to_fqdn.items()}
+        cached = (id_to_fqdn, id_descriptions, fqdn_to_id)
+        _ID_MAP_CACHE = cached
+
+    return cached
+
+
 def create_component_id_map(components: Dict[str, Node]) -> tuple[Dict[int, str], Dict[str, str]]:
     """
     Create bidirectional ID mapping for components.
 
+    Cached per components dict; see _component_id_maps.
+
     Returns:
         - id_to_fqdn: {0: "full.path.ClassName", 1: ...}
         - id_descriptions: {"0": "ClassName (module-name, package)", ...}
     """
-    id_to_fqdn = {}
-    id_descriptions = {}
-
-    logger.info("🔢 Creating component ID mapping")
-
-    for idx, (fqdn, component_data) in enumerate(sorted(components.items())):
-        id_to_fqdn[idx] = fqdn
-
-        # Extract human-readable parts
-        if '::' in fqdn:
-            class_name = fqdn.split('::')[-1]
-        else:
-            class_name = fqdn.split('.')[-1]
-
-        module_hint = extract_module_hint(fqdn)
-        package_hint = extract_package_hint(fqdn)
+    id_to_fqdn, id_descriptions, _ = _component_id_maps(components)
+    return id_to_fqdn, id_descriptions
 
-        # Create concise description
-        id_descriptions[str(idx)] = f"{class_name} ({module_hint}, {package_hint})"
 
-    logger.info(f"   ✅ Created {len(id_to_fqdn)} component ID mappings")
-    logger.debug(f"   Example: 0 → {id_descriptions.get('0', 'N/A')}")
+# Presorted display order, scoped like the ID maps: components are listed
+# grouped by file (files sorted) and sorted within each file, so one global
+# sort by (relative_path, fqdn) fixes every component's rank once per run.
+# Per-call ordering then becomes a single integer-key sort instead of one
+# sort per file plus a sort of the file keys.
+_SORT_RANK_CACHE: Optional[Dict[str, int]] = None
+
+
+def _component_sort_ranks(components: Dict[str, Node]) -> Dict[str, int]:
+    global _SORT_RANK_CACHE
+    _scope_caches_to(components)
+    ranks = _SORT_RANK_CACHE
+    if ranks is None:
+        ordered = sorted(components, key=lambda fqdn: (components[fqdn].relative_path, fqdn))
+        ranks = {fqdn: idx for idx, fqdn in enumerate(ordered)}
+        _SORT_RANK_CACHE = ranks
+    return ranks
+
+
+# Per-component caches, keyed by FQDN but scoped (via _scope_caches_to) to
+# the current components dict: the same FQDN can reappear across jobs with
+# different source — or a different integer id — after the worker
+# re-analyzes a repo, so blocks must not outlive the run that built them.
+# Within a run the same component often lands in several sibling/cousin
+# sub-modules (shared utils are the common case), and its with-code prompt
+# block and token count never change, so each is formatted and tokenized
+# exactly once per FQDN.
+_SRC_BLOCK_CACHE: Dict[str, str] = {}
+_SRC_TOKEN_CACHE: Dict[str, int] = {}
+
+
+def _component_block(fqdn: str, components: Dict[str, Node]) -> str:
+    """Return the with-code prompt block for one component, cached per FQDN."""
+    _scope_caches_to(components)
+    block = _SRC_BLOCK_CACHE.get(fqdn)
+    if block is None:
+        _, id_descriptions, fqdn_to_id = _component_id_maps(components)
+        comp_id = fqdn_to_id[fqdn]
+        block = f"\t{comp_id}: {id_descriptions[str(comp_id)]}\n{components[fqdn].source_code}\n"
+        _SRC_BLOCK_CACHE[fqdn] = block
+    return block
+
+
+def estimate_components_tokens(leaf_nodes: List[str], components: Dict[str, Node]) -> int:
+    """
+    Sum of per-component token counts for the with-code listing.
 
-    return id_to_fqdn, id_descriptions
+    Cheap sizing for the leaf bin-packer: summing cached per-FQDN counts
+    avoids rebuilding and re-tokenizing the concatenated payload. The sum
+    can differ from tokenizing the joined string by a few tokens at block
+    boundaries, which is irrelevant for threshold/packing decisions.
+    """
+    _scope_caches_to(components)
+    total = 0
+    uncounted = []
+    for fqdn in leaf_nodes:
+        if fqdn in components:
+            cached = _SRC_TOKEN_CACHE.get(fqdn)
+            if cached is None:
+                uncounted.append(fqdn)
+            else:
+                total += cached
+    if uncounted:
+        # One encode_batch call for all misses instead of a tokenizer
+        # invocation per component
+        for fqdn, count in zip(uncounted, count_tokens_many(
+                [_component_block(fqdn, components) for fqdn in uncounted])):
+            _SRC_TOKEN_CACHE[fqdn] = count
+            total += count
+    return total
 
 
 def format_potential_core_components(
     leaf_nodes: List[str],
-    components: Dict[str, Node]
+    components: Dict[str, Node],
+    assume_valid: bool = False,
+    include_code: bool = True
 ) -> tuple[str, str, Dict[int, str], Dict[str, str]]:
     """
     Format the potential core components into a string that can be used in the prompt.
@@ -121,6 +262,13 @@ def format_potential_core_components(
     Args:
         leaf_nodes: List of component FQDNs (fully qualified domain names)
         components: Dictionary mapping FQDNs to Node objects
+        assume_valid: Skip the membership filter when the caller has already
+            validated every leaf node against components (the clustering
+            path does), avoiding a redundant pass
+        include_code: When False, skip assembling the with-code variant
+            (megabytes of source on large repos) and return "" in its
+            place; clustering only needs the plain listing since token
+            sizing comes from the cached per-FQDN counts
 
     Returns:
         Tuple of:
@@ -134,79 +282,93 @@ def format_potential_core_components(
     logger.debug(f"   ├─ Components dict keys: FQDN (node.id)")
     logger.debug(f"   └─ Input: {len(leaf_nodes)} leaf nodes, {len(components)} components")
 
-    # Create ID mapping FIRST (before filtering)
-    id_to_fqdn, id_descriptions = create_component_id_map(components)
-
-    # Create reverse mapping for quick lookup
-    fqdn_to_id = {fqdn: idx for idx, fqdn in id_to_fqdn.items()}
-
-    # Filter out any invalid leaf nodes that don't exist in components
-    valid_leaf_nodes = []
-    skipped_count = 0
-    for leaf_node in leaf_nodes:
-        if leaf_node in components:
-            valid_leaf_nodes.append(leaf_node)
-        else:
-            skipped_count += 1
-            # Extract namespace from FQDN (e.g., "main-repo" from "main-repo.src/...")
-            namespace = ""
-            is_deps = False
-            if '.' in leaf_node:
-                namespace = leaf_node.split('.')[0]
-                is_deps = namespace.startswith('deps/')
-
-            # Extract file path if present
-            file_hint = ""
-            if '::' in leaf_node:
-                file_part = leaf_node.split('::')[0]
-                file_hint = f" (from {file_part})"
-
-            logger.warning(
-                f"Skipping invalid leaf node '{leaf_node}'{file_hint}\n"
-                f"   ├─ FQDN format: {leaf_node}\n"
-                f"   ├─ Namespace: {namespace or '(unknown)'}\n"
-                f"   ├─ Source: {'dependency repo' if is_deps else 'main repo'}\n"
-                f"   └─ Reason: Component not found in components dictionary\n"
-                f"   └─ Possible causes:\n"
-                f"      • File was excluded by filters (tests, specs, node_modules, etc.)\n"
-                f"      • Parsing failed for this component\n"
-                f"      • Component is from a dependency/external library\n"
-                f"      • File extension not supported"
+    # Create ID mapping FIRST (before filtering); cached per components dict
+    # along with the reverse map
+    id_to_fqdn, id_descriptions, fqdn_to_id = _component_id_maps(components)
+
+    # Filter out any invalid leaf nodes that don't exist in components.
+    # The diagnostic text is built only when warnings are enabled and
+    # something was actually skipped, and lands in one aggregated warning
+    # instead of a ten-line block per bad node.
+    if assume_valid:
+        valid_leaf_nodes = list(leaf_nodes)
+        skipped_count = 0
+    else:
+        valid_leaf_nodes = [leaf_node for leaf_node in leaf_nodes if leaf_node in components]
+        skipped_count = len(leaf_nodes) - len(valid_leaf_nodes)
+    if skipped_count > 0 and logger.isEnabledFor(logging.WARNING):
+        skipped_details = []
+        for leaf_node in leaf_nodes:
+            if leaf_node in components:
+                continue
+            # Extract namespace from FQDN (e.g., "main-repo" from "main-repo.src/...");
+            # partition avoids allocating a full segment list per node
+            namespace, dot, _ = leaf_node.partition('.')
+            if not dot:
+                namespace = ""
+            is_deps = namespace.startswith('deps/')
+            file_part, sep, _ = leaf_node.partition('::')
+            file_hint = f" (from {file_part})" if sep else ""
+            skipped_details.append(
+                f"   ├─ '{leaf_node}'{file_hint} "
+                f"(namespace: {namespace or '(unknown)'}, "
+                f"{'dependency repo' if is_deps else 'main repo'})"
             )
+        logger.warning(
+            f"Skipping {skipped_count} invalid leaf nodes - not found in components dictionary\n"
+            + "\n".join(skipped_details) + "\n"
+            f"   └─ Possible causes:\n"
+            f"      • File was excluded by filters (tests, specs, node_modules, etc.)\n"
+            f"      • Parsing failed for this component\n"
+            f"      • Component is from a dependency/external library\n"
+            f"      • File extension not supported"
+        )
 
     if skipped_count > 0:
         logger.info(f"📊 Leaf node filtering: {len(valid_leaf_nodes)} valid, {skipped_count} skipped ({len(leaf_nodes)} total)")
 
-    # Group leaf nodes by file
-    leaf_nodes_by_file = defaultdict(list)
+    # Order leaf nodes by the cached global (file, fqdn) ranks: one
+    # integer-key sort replaces the old per-file grouping with its sort of
+    # the file keys plus a sort inside every file. Output order is
+    # identical.
+    ranks = _component_sort_ranks(components)
+    valid_leaf_nodes.sort(key=ranks.__getitem__)
+
+    logger.debug(f"   └─ Valid leaf nodes: {len(valid_leaf_nodes)}")
+
+    # Build ID-based component lists. Accumulate into lists and join once:
+    # repeated `+=` on strings is quadratic in the worst case, and the
+    # with-code variant carries full source for every component.
+    parts = []
+    parts_with_code = []
+    append_part = parts.append
+    append_with_code = parts_with_code.append if include_code else (lambda piece: None)
+
+    current_file = None
+    get_node = components.__getitem__
     for leaf_node in valid_leaf_nodes:
-        leaf_nodes_by_file[components[leaf_node].relative_path].append(leaf_node)
-
-    logger.debug(f"   ├─ Valid leaf nodes: {len(valid_leaf_nodes)}")
-    logger.debug(f"   └─ Grouped into {len(leaf_nodes_by_file)} files")
-
-    # Build ID-based component lists
-    potential_core_components = ""
-    potential_core_components_with_code = ""
-
-    for file, leaf_nodes_in_file in sorted(leaf_nodes_by_file.items()):
-        potential_core_components += f"# {file}\n"
-        potential_core_components_with_code += f"# {file}\n"
-
-        for leaf_node in sorted(leaf_nodes_in_file):
-            # Get ID for this FQDN
-            comp_id = fqdn_to_id.get(leaf_node)
-            if comp_id is None:
-                logger.warning(f"   ⚠️  No ID found for {leaf_node}")
-                continue
-
-            # Use ID and description instead of FQDN
-            comp_desc = id_descriptions[str(comp_id)]
-            potential_core_components += f"\t{comp_id}: {comp_desc}\n"
-            potential_core_components_with_code += f"\t{comp_id}: {comp_desc}\n"
-            potential_core_components_with_code += f"{components[leaf_node].source_code}\n"
-
-    return potential_core_components, potential_core_components_with_code, id_to_fqdn, id_descriptions
+        file = get_node(leaf_node).relative_path
+        if file != current_file:
+            current_file = file
+            file_header = f"# {file}\n"
+            append_part(file_header)
+            append_with_code(file_header)
+
+        # Get ID for this FQDN
+        comp_id = fqdn_to_id.get(leaf_node)
+        if comp_id is None:
+            logger.warning(f"   ⚠️  No ID found for {leaf_node}")
+            continue
+
+        # Use ID and description instead of FQDN; the with-code block
+        # comes from the per-FQDN cache so shared components are only
+        # formatted once across sub-modules
+        comp_desc = id_descriptions[str(comp_id)]
+        append_part(f"\t{comp_id}: {comp_desc}\n")
+        if include_code:
+            parts_with_code.append(_component_block(leaf_node, components))
+
+    return "".join(parts), "".join(parts_with_code) if include_code else "", id_to_fqdn, id_descriptions
 
 
 def normalize_component_ids_by_lookup(
@@ -229,35 +391,42 @@ def normalize_component_ids_by_lookup(
     total_normalized = 0
     total_failed = 0
     max_id = len(id_to_fqdn) - 1
+    # The per-success debug line is only worth formatting when it will be
+    # emitted; on large trees this loop runs for every component
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    lookup = id_to_fqdn.get
 
     for module_name, module_data in module_tree.items():
         component_ids = module_data.get('components', [])
         normalized_components = []
+        append = normalized_components.append
+        failed = []
 
         for comp_id in component_ids:
             # Convert to int and validate
             try:
                 idx = int(comp_id)
-                if idx in id_to_fqdn:
-                    fqdn = id_to_fqdn[idx]
-                    normalized_components.append(fqdn)
-                    total_normalized += 1
-                    logger.debug(f"   ✅ ID {idx} → {fqdn}")
-                else:
-                    logger.warning(
-                        f"   ❌ Invalid ID {idx} in module '{module_name}'\n"
-                        f"      ├─ Valid range: 0-{max_id}\n"
-                        f"      └─ LLM returned out-of-range ID"
-                    )
-                    total_failed += 1
-            except (ValueError, TypeError) as e:
-                logger.warning(
-                    f"   ❌ Non-integer ID in module '{module_name}'\n"
-                    f"      ├─ Received: {comp_id} (type: {type(comp_id).__name__})\n"
-                    f"      ├─ Error: {e}\n"
-                    f"      └─ LLM must return integer IDs only"
-                )
-                total_failed += 1
+            except (ValueError, TypeError):
+                failed.append(f"{comp_id!r} (type: {type(comp_id).__name__}, non-integer)")
+                continue
+            fqdn = lookup(idx)
+            if fqdn is None:
+                failed.append(f"{idx} (out of range)")
+                continue
+            append(fqdn)
+            total_normalized += 1
+            if debug_enabled:
+                logger.debug(f"   ✅ ID {idx} → {fqdn}")
+
+        # Aggregate failures into one warning per module instead of one
+        # multi-line warning per bad ID
+        if failed:
+            total_failed += len(failed)
+            logger.warning(
+                f"   ❌ Failed to normalize {len(failed)} component IDs in module '{module_name}'\n"
+                f"      ├─ Invalid IDs: {', '.join(failed)}\n"
+                f"      └─ LLM must return integer IDs in range 0-{max_id}"
+            )
 
         module_data['components'] = normalized_components
 
@@ -268,17 +437,39 @@ def normalize_component_ids_by_lookup(
     return module_tree
 
 
-def cluster_modules(
+# Clustering responses memoized by prompt digest (and model). Identical
+# prompts recur on retries after parse failures and, occasionally, when
+# symmetric branches produce the same sub-problem; replaying the cached
+# response costs a dict lookup instead of a full LLM round-trip. Bounded
+# LRU so a long run over many repos can't grow it without limit.
+_CLUSTER_RESPONSE_CACHE_MAX = 256
+_CLUSTER_RESPONSE_CACHE: OrderedDict[tuple[str, str], str] = OrderedDict()
+
+
+async def cluster_modules_async(
     leaf_nodes: List[str],
     components: Dict[str, Node],
     config: Config,
-    current_module_tree: dict[str, Any] = {},
-    current_module_name: str = None,
-    current_module_path: List[str] = []
+    current_module_tree: Optional[dict[str, Any]] = None,
+    current_module_name: Optional[str] = None,
+    current_module_path: tuple[str, ...] = ()
 ) -> Dict[str, Any]:
     """
     Cluster the potential core components into modules.
+
+    Sibling sub-modules are independent, so the recursion fans out with
+    asyncio.gather and the blocking LLM call runs in a worker thread; the
+    wall-clock cost per tree level is the slowest sibling, not the sum.
     """
+    # None sentinel instead of a mutable default: the old `={}` default
+    # was created once and shared across calls, so a second top-level run
+    # in the same process would see (and mutate) the previous run's tree.
+    # The path is an immutable tuple — safe as a default and cheaper to
+    # extend per child than copying a list.
+    if current_module_tree is None:
+        current_module_tree = {}
+    if not isinstance(current_module_path, tuple):
+        current_module_path = tuple(current_module_path)
     logger.info("🗂️  Module Clustering Operation")
     logger.info(f"   ├─ Current module: {current_module_name or '(repository level)'}")
     logger.info(f"   ├─ Module path: {' > '.join(current_module_path) if current_module_path else '(root)'}")
@@ -286,8 +477,11 @@ def cluster_modules(
     logger.info(f"   └─ Components dictionary size: {len(components)} components")
     logger.info("")
 
-    # ✅ Pre-flight validation - check all leaf nodes exist in components
-    if not validate_components_before_clustering(components, leaf_nodes):
+    # ✅ Pre-flight validation - check all leaf nodes exist in components.
+    # The cheap all() probe short-circuits the common recursive case where
+    # the parent already filtered its children, skipping the validator's
+    # full key-set copy and log output.
+    if not all(ln in components for ln in leaf_nodes) and not validate_components_before_clustering(components, leaf_nodes):
         logger.warning("⚠️  Pre-flight validation found issues, filtering out missing components...")
         # Filter out missing components
         valid_leaf_nodes = [ln for ln in leaf_nodes if ln in components]
@@ -298,14 +492,11 @@ def cluster_modules(
             logger.error("❌ No valid leaf nodes remaining after filtering")
             return {}
 
-    # Get ID-based component formatting
-    potential_core_components, potential_core_components_with_code, id_to_fqdn, id_descriptions = \
-        format_potential_core_components(leaf_nodes, components)
-
-    token_count = count_tokens(potential_core_components_with_code)
-    logger.info(f"   ├─ Potential components (with code): {token_count} tokens")
-    logger.info(f"   ├─ Max token per module: {config.max_token_per_module}")
-    logger.info(f"   └─ ID-based system: {len(id_to_fqdn)} components mapped")
+    # Size from the cached per-FQDN counts — the with-code payload is never
+    # assembled here; it existed only to be tokenized and thrown away. The
+    # estimate omits just the small file-header tokens, an acceptable margin
+    # for a split/don't-split heuristic.
+    token_count = estimate_components_tokens(leaf_nodes, components)
 
     # Only skip clustering for RECURSIVE sub-module calls (current_module_name is set):
     # a sub-module that already fits under the threshold must not be split further.
@@ -314,20 +505,45 @@ def cluster_modules(
     # and the caller falls back to arbitrary synthetic `module_1/module_2/...` buckets
     # instead of real, semantically-named modules.
     if current_module_name is not None and token_count <= config.max_token_per_module:
-        logger.info(f"   └─ ⏭️  Skipping clustering - sub-module fits in single unit ({token_count} ≤ {config.max_token_per_module})")
+        logger.info(f"   └─ ⏭️  Skipping clustering - sub-module fits in single unit (~{token_count} ≤ {config.max_token_per_module}, estimated)")
         return {}
 
+    # Get ID-based component formatting; the pre-flight check above already
+    # guaranteed membership, so the formatter skips its own filter pass,
+    # and the prompt only needs the plain listing
+    potential_core_components, _, id_to_fqdn, id_descriptions = \
+        format_potential_core_components(leaf_nodes, components, assume_valid=True, include_code=False)
+
+    logger.info(f"   ├─ Potential components (with code): ~{token_count} tokens (estimated)")
+    logger.info(f"   ├─ Max token per module: {config.max_token_per_module}")
+    logger.info(f"   └─ ID-based system: {len(id_to_fqdn)} components mapped")
     logger.info(f"   └─ ✅ Proceeding with clustering - components exceed threshold")
     logger.info("")
 
-    prompt = format_cluster_prompt(potential_core_components, current_module_tree, current_module_name)
+    system_prompt, prompt = format_cluster_prompt(potential_core_components, current_module_tree, current_module_name)
     logger.info(f"🤖 Calling clustering LLM")
     logger.info(f"   ├─ Model: {config.cluster_model}")
     logger.info(f"   ├─ Prompt uses ID-based component references")
     logger.info(f"   └─ LLM will return integer IDs (0-{len(id_to_fqdn)-1})")
     logger.info("")
 
-    response = call_llm(prompt, config, model=config.cluster_model)
+    # The static instruction block rides in the system message so every
+    # clustering call shares the same cacheable prefix. call_llm is a
+    # blocking HTTP round-trip, so it runs in a thread to keep sibling
+    # clustering calls in flight concurrently. Responses are memoized by
+    # prompt digest: identical sub-problems (retries, symmetric branches)
+    # skip the round-trip entirely.
+    cache_key = (hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest(), config.cluster_model)
+    response = _CLUSTER_RESPONSE_CACHE.get(cache_key)
+    if response is not None:
+        _CLUSTER_RESPONSE_CACHE.move_to_end(cache_key)
+        logger.info("   ✅ Clustering response served from cache")
+    else:
+        response = await asyncio.to_thread(call_llm, prompt, config, model=config.cluster_model, system=system_prompt)
+        if response:
+            _CLUSTER_RESPONSE_CACHE[cache_key] = response
+            if len(_CLUSTER_RESPONSE_CACHE) > _CLUSTER_RESPONSE_CACHE_MAX:
+                _CLUSTER_RESPONSE_CACHE.popitem(last=False)
 
     logger.info(f"   ✅ Clustering LLM response received")
     logger.info(f"   ├─ Response length: {len(response)} chars")
@@ -335,21 +551,31 @@ def cluster_modules(
     logger.info("")
 
     # Parse the response
-    import json
     try:
-        if "<GROUPED_COMPONENTS>" not in response or "</GROUPED_COMPONENTS>" not in response:
+        tag_match = _GROUPED_COMPONENTS_RE.search(response)
+        if tag_match is None:
             logger.error(f"Invalid LLM response format - missing component tags: {response[:200]}...")
             return {}
 
-        response_content = response.split("<GROUPED_COMPONENTS>")[1].split("</GROUPED_COMPONENTS>")[0]
+        response_content = tag_match.group(1)
 
-        # Parse JSON safely (no code execution)
+        # Parse JSON safely (no code execution). Some models emit
+        # Python-literal dicts (single quotes, True/None) despite the JSON
+        # instruction; ast.literal_eval handles those without evaluating
+        # code. orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+        # one except clause covers both parsers.
         try:
-            module_tree = json.loads(response_content)
+            if orjson is not None:
+                module_tree = orjson.loads(response_content)
+            else:
+                module_tree = json.loads(response_content)
         except json.JSONDecodeError as e:
-            logger.error(f"❌ Invalid JSON in LLM response: {e}")
-            logger.error(f"Response excerpt: {response_content[:500]}...")
-            return {}
+            try:
+                module_tree = ast.literal_eval(response_content)
+            except (ValueError, SyntaxError):
+                logger.error(f"❌ Invalid JSON in LLM response: {e}")
+                logger.error(f"Response excerpt: {response_content[:500]}...")
+                return {}
 
         if not isinstance(module_tree, dict):
             logger.error(f"Invalid module tree format - expected dict, got {type(module_tree)}")
@@ -394,65 +620,102 @@ def cluster_modules(
         logger.debug(f"Skipping clustering for {current_module_name} because the module tree is too small: {len(module_tree)} modules")
         return {}
 
-    if current_module_tree == {}:
+    # Each recursion returns its local subtree and the caller attaches it
+    # under module_info["children"]; the old root-to-node graft walked
+    # current_module_path from the root on every call (O(depth) per call,
+    # O(depth^2) overall) only to write the same dicts the return path
+    # already wires up. Sub-module entries still drop the "path" key the
+    # LLM echoes back; top-level modules keep it, as before.
+    if current_module_name is None:
         current_module_tree = module_tree
     else:
-        value = current_module_tree
-        for key in current_module_path:
-            # Ensure the key exists and has a children dict
-            if key not in value:
-                logger.warning(f"Module '{key}' not found in tree during clustering")
-                value[key] = {"children": {}}
-            if "children" not in value[key]:
-                logger.warning(f"Module '{key}' missing 'children' key during clustering")
-                value[key]["children"] = {}
-            value = value[key]["children"]
-        for module_name, module_info in module_tree.items():
-            del module_info["path"]
-            value[module_name] = module_info
-
+        for module_info in module_tree.values():
+            module_info.pop("path", None)
+
+    async def _cluster_child(module_name: str, module_info: dict, sub_leaf_nodes: List[str]) -> None:
+        # Each child gets its own path list; the old shared append/pop
+        # protocol would corrupt sibling paths once children run concurrently
+        module_info["children"] = await cluster_modules_async(
+            sub_leaf_nodes, components, config, current_module_tree,
+            module_name, current_module_path + (module_name,)
+        )
+
+    tasks = []
     for module_name, module_info in module_tree.items():
         sub_leaf_nodes = module_info.get("components", [])
 
-        # Filter sub_leaf_nodes to ensure they exist in components
-        valid_sub_leaf_nodes = []
-        sub_skipped = 0
-        for node in sub_leaf_nodes:
-            if node in components:
-                valid_sub_leaf_nodes.append(node)
-            else:
-                sub_skipped += 1
-                # Extract namespace from FQDN
-                namespace = ""
-                is_deps = False
-                if '.' in node:
-                    namespace = node.split('.')[0]
-                    is_deps = namespace.startswith('deps/')
-
+        # Filter sub_leaf_nodes to ensure they exist in components. The
+        # diagnostic detail (namespace, substring scan over all FQDNs for
+        # possible matches) is only assembled when something was actually
+        # invalid, and lands in one aggregated warning per module.
+        valid_sub_leaf_nodes = [node for node in sub_leaf_nodes if node in components]
+        if len(valid_sub_leaf_nodes) != len(sub_leaf_nodes):
+            invalid_details = []
+            for node in sub_leaf_nodes:
+                if node in components:
+                    continue
+                namespace, dot, _ = node.partition('.')
+                if not dot:
+                    namespace = ""
+                is_deps = namespace.startswith('deps/')
                 # Show available FQDNs for debugging
                 possible_matches = [fqdn for fqdn in components.keys() if node in fqdn][:3]
-
-                logger.warning(
-                    f"Skipping invalid sub leaf node '{node}' in module '{module_name}'\n"
-                    f"   ├─ FQDN format: {node}\n"
-                    f"   ├─ Namespace: {namespace or '(unknown)'}\n"
-                    f"   ├─ Source: {'dependency repo' if is_deps else 'main repo'}\n"
-                    f"   ├─ Possible matches in components: {possible_matches if possible_matches else 'None'}\n"
-                    f"   └─ Reason: Component not found after ID normalization\n"
-                    f"   └─ This should not happen with ID-based system - possible LLM error"
+                invalid_details.append(
+                    f"      ├─ '{node}' ({'dependency repo' if is_deps else 'main repo'}, "
+                    f"namespace: {namespace or '(unknown)'}, "
+                    f"possible matches: {possible_matches if possible_matches else 'None'})"
                 )
+            logger.warning(
+                f"Skipping {len(invalid_details)} invalid sub leaf nodes in module '{module_name}'\n"
+                + "\n".join(invalid_details) + "\n"
+                f"      └─ Reason: Component not found after ID normalization\n"
+                f"         This should not happen with ID-based system - possible LLM error"
+            )
+            logger.info(f"📊 Sub-module '{module_name}': {len(valid_sub_leaf_nodes)} valid nodes, {len(invalid_details)} skipped")
 
-        if sub_skipped > 0:
-            logger.info(f"📊 Sub-module '{module_name}': {len(valid_sub_leaf_nodes)} valid nodes, {sub_skipped} skipped")
-
-        current_module_path.append(module_name)
         module_info["children"] = {}
-        module_info["children"] = cluster_modules(valid_sub_leaf_nodes, components, config, current_module_tree, module_name, current_module_path)
-        current_module_path.pop()
+        # Don't recurse at all when the child would immediately skip: a
+        # module with at most one component cannot be split (the recursion
+        # would burn an LLM call just to return an empty tree — a single
+        # oversized component slips past the token gate below), and the
+        # cached per-FQDN estimate answers the fits/doesn't-fit question
+        # here, saving the call overhead and its log preamble for every
+        # leaf-sized module (the majority in most repos)
+        if len(valid_sub_leaf_nodes) <= 1:
+            continue
+        if estimate_components_tokens(valid_sub_leaf_nodes, components) <= config.max_token_per_module:
+            logger.debug(f"   ⏭️  Not recursing into '{module_name}' - fits in single unit")
+            continue
+        tasks.append(_cluster_child(module_name, module_info, valid_sub_leaf_nodes))
+
+    # Fan out: sibling modules cluster concurrently. Tree grafts happen in
+    # the synchronous stretches between awaits and each child writes only
+    # its own subtree, so no extra locking is needed under asyncio.
+    await asyncio.gather(*tasks)
 
     return module_tree
 
 
+def cluster_modules(
+    leaf_nodes: List[str],
+    components: Dict[str, Node],
+    config: Config,
+    current_module_tree: Optional[dict[str, Any]] = None,
+    current_module_name: Optional[str] = None,
+    current_module_path: tuple[str, ...] = ()
+) -> Dict[str, Any]:
+    """
+    Synchronous entry point for cluster_modules_async.
+
+    Kept for callers outside an event loop; async callers should await
+    cluster_modules_async directly (asyncio.run fails inside a running loop).
+    """
+    return asyncio.run(cluster_modules_async(
+        leaf_nodes, components, config,
+        current_module_tree, current_module_name, current_module_path
+    ))
+
+
 # ============================================================================
 # BACKWARD COMPATIBILITY LAYER
 # ============================================================================
@@ -279,7 +279,7 @@ class AnalysisService:
         logger.debug("No README file found in repository root.")
         return None
 
-    def _analyze_call_graph(self, file_tree: Dict[str, Any], repo_dir: str) -> Dict[str, Any]:
+    def _analyze_call_graph(self, file_tree: Dict[str, Any], repo_dir: str, file_index=None) -> Dict[str, Any]:
         """
         Perform multi-language call graph analysis.
 
@@ -312,7 +312,7 @@ class AnalysisService:
                 logger.debug(f"│  ├─ {lang}: {count}")
 
         logger.debug(f"└─ Analyzing {len(supported_files)} files with AST parsers...")
-        result = self.call_graph_analyzer.analyze_code_files(supported_files, repo_dir)
+        result = self.call_graph_analyzer.analyze_code_files(supported_files, repo_dir, file_index=file_index)
 
         result["call_graph"]["supported_languages"] = self._get_supported_languages()
         result["call_graph"]["unsupported_files"] = unsupported_count
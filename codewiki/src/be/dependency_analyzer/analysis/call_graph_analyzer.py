@@ -8,7 +8,10 @@ across different programming languages in a repository.
 
 from typing import Dict, List
 import logging
+import os
 import traceback
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from codewiki.src.be.dependency_analyzer.models.core import Node, CallRelationship
 from codewiki.src.be.dependency_analyzer.utils.patterns import CODE_EXTENSIONS
@@ -16,6 +19,24 @@ from codewiki.src.be.dependency_analyzer.utils.security import safe_open_text
 
 logger = logging.getLogger(__name__)
 
+# Parsing is CPU-bound (tree-sitter/AST per file), so worker processes give
+# real parallelism where threads would serialize on the GIL. Below this many
+# files the pool spawn cost outweighs the speedup.
+_PARALLEL_PARSE_MIN_FILES = 8
+
+
+def _analyze_file_worker(base_dir: str, file_info: Dict) -> tuple:
+    """
+    Parse one file in a worker process.
+
+    Top-level (picklable) entry point: builds a throwaway analyzer, runs the
+    same per-file routine as the sequential path, and returns its functions
+    and relationships for the parent process to merge.
+    """
+    analyzer = CallGraphAnalyzer()
+    analyzer._analyze_code_file(base_dir, file_info)
+    return analyzer.functions, analyzer.call_relationships
+
 
 class CallGraphAnalyzer:
     def __init__(self):
@@ -24,25 +45,78 @@ class CallGraphAnalyzer:
         self.call_relationships: List[CallRelationship] = []
         logger.debug("CallGraphAnalyzer initialized.")
 
-    def analyze_code_files(self, code_files: List[Dict], base_dir: str) -> Dict:
+    def analyze_code_files(self, code_files: List[Dict], base_dir: str, file_index=None) -> Dict:
         """
         Complete analysis: Analyze all files to build complete call graph with all nodes.
 
         This approach:
-        1. Analyzes all code files 
+        1. Analyzes all code files
         2. Extracts all functions and relationships
         3. Builds complete call graph
-        4. Returns all nodes and relationships 
+        4. Returns all nodes and relationships
+
+        When a FileIndex is given, files whose stat signature is unchanged
+        reuse their cached parse output and only modified files are parsed.
         """
         logger.debug(f"Starting analysis of {len(code_files)} files")
 
         self.functions = {}
         self.call_relationships = []
 
+        # Per-file results keyed by path so cached and freshly parsed files
+        # can be merged back in input order afterwards
+        results: Dict[str, tuple] = {}
+        pending = code_files
+        if file_index is not None:
+            pending = []
+            for file_info in code_files:
+                cached = file_index.load(base_dir, file_info["path"])
+                if cached is not None:
+                    results[file_info["path"]] = cached
+                else:
+                    pending.append(file_info)
+            if results:
+                logger.debug(f"Reusing cached parse output for {len(results)} unchanged files")
+
+        max_workers = os.cpu_count() or 1
+        use_pool = max_workers > 1 and len(pending) >= _PARALLEL_PARSE_MIN_FILES
+
+        if use_pool:
+            logger.debug(f"Parsing {len(pending)} files across {max_workers} worker processes")
+            try:
+                # per-file errors are caught and logged inside the worker,
+                # matching sequential behavior
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    for file_info, parsed in zip(
+                        pending,
+                        executor.map(_analyze_file_worker, repeat(base_dir), pending, chunksize=16),
+                    ):
+                        results[file_info["path"]] = parsed
+            except Exception as e:
+                logger.error(f"⚠️ Parallel parsing failed, falling back to sequential analysis: {e}")
+                logger.error(f"Traceback: {traceback.format_exc()}")
+                for file_info in pending:
+                    results.pop(file_info["path"], None)
+                use_pool = False
+
+        if not use_pool:
+            for file_info in pending:
+                logger.debug(f"Analyzing: {file_info['path']}")
+                results[file_info["path"]] = _analyze_file_worker(base_dir, file_info)
+
+        # Record freshly parsed files under their current stat signature
+        if file_index is not None and pending:
+            for file_info in pending:
+                functions, relationships = results[file_info["path"]]
+                file_index.store(base_dir, file_info["path"], functions, relationships)
+            file_index.commit()
+
+        # Merge in input order so output matches the old sequential loop
         files_analyzed = 0
         for file_info in code_files:
-            logger.debug(f"Analyzing: {file_info['path']}")
-            self._analyze_code_file(base_dir, file_info)
+            functions, relationships = results.get(file_info["path"], ({}, []))
+            self.functions.update(functions)
+            self.call_relationships.extend(relationships)
             files_analyzed += 1
         logger.debug(
             f"Analysis complete: {files_analyzed} files analyzed, {len(self.functions)} functions, {len(self.call_relationships)} relationships"
@@ -1,4 +1,5 @@
 import os
+import sys
 import json
 import logging
 import argparse
@@ -7,6 +8,14 @@ from typing import Dict, List, Set, Tuple, Optional, Any, Union
 from pathlib import Path
 import re
 
+# orjson serializes large graphs several times faster than stdlib json and
+# writes bytes directly; fall back silently when it isn't installed
+# (optional dependency, same pattern as cluster_modules)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from codewiki.src.be.dependency_analyzer.analysis.analysis_service import AnalysisService
 from codewiki.src.be.dependency_analyzer.models.core import Node
 
@@ -18,7 +27,7 @@ logger.setLevel(logging.DEBUG)
 class DependencyParser:
     """Parser for extracting code components from multi-language repositories."""
 
-    def __init__(self, repo_path: Union[str, List[str]], include_patterns: List[str] = None, exclude_patterns: List[str] = None):
+    def __init__(self, repo_path: Union[str, List[str]], include_patterns: List[str] = None, exclude_patterns: List[str] = None, file_index=None):
         """
         Initialize the dependency parser.
 
@@ -26,6 +35,7 @@ class DependencyParser:
             repo_path: Path to the repository or list of paths to multiple repositories
             include_patterns: File patterns to include (e.g., ["*.cs", "*.py"])
             exclude_patterns: File/directory patterns to exclude (e.g., ["*Tests*"])
+            file_index: Optional FileIndex; unchanged files reuse cached parse output
         """
         # Support both single path (str) and multiple paths (List[str])
         if isinstance(repo_path, str):
@@ -39,6 +49,7 @@ class DependencyParser:
         self.modules: Set[str] = set()
         self.include_patterns = include_patterns
         self.exclude_patterns = exclude_patterns
+        self.file_index = file_index
 
         self.analysis_service = AnalysisService()
 
@@ -86,7 +97,8 @@ class DependencyParser:
         logger.info("├─ Step 2.2: Building call graph...")
         call_graph_result = self.analysis_service._analyze_call_graph(
             structure_result["file_tree"],
-            repo_path
+            repo_path,
+            file_index=self.file_index
         )
         logger.info(f"│  ├─ Extracted {len(call_graph_result.get('functions', []))} functions/classes")
         logger.info(f"│  └─ Found {len(call_graph_result.get('relationships', []))} relationships")
@@ -139,7 +151,8 @@ class DependencyParser:
             # Analyze call graph
             call_graph_result = self.analysis_service._analyze_call_graph(
                 structure_result["file_tree"],
-                repo_path
+                repo_path,
+                file_index=self.file_index
             )
 
             # Build components with namespace (idx=0 is main repo, idx>0 is deps)
@@ -225,8 +238,11 @@ class DependencyParser:
             if not original_id:
                 continue
 
-            # Create FQDN (namespaced component ID)
-            fqdn = f"{namespace}.{original_id}"
+            # Create FQDN (namespaced component ID). Interned so every
+            # downstream `in components` / dict lookup compares by identity:
+            # FQDNs are long strings hashed and compared millions of times
+            # during clustering and documentation generation.
+            fqdn = sys.intern(f"{namespace}.{original_id}")
 
             # Store mapping for dependency resolution
             namespace_mapping[original_id] = fqdn
@@ -300,6 +316,15 @@ class DependencyParser:
         """
         cross_deps_resolved = 0
 
+        # Index components by name once instead of rescanning (and re-sorting)
+        # the whole dict for every unresolved dependency — the old inner loop
+        # was O(N²·log N) over the full component set. Buckets are built from
+        # the sorted items, so "first name match" picks the same component the
+        # sorted scan did.  # ✅ SORT (once) for determinism
+        name_index: Dict[str, List[str]] = {}
+        for other_id, other_component in sorted(all_components.items()):
+            name_index.setdefault(other_component.name, []).append(other_id)
+
         # For each component, check if any dependencies need cross-namespace resolution
         for component_id, component in sorted(all_components.items()):  # ✅ SORT for determinism
             resolved_deps = set()
@@ -311,8 +336,8 @@ class DependencyParser:
                 else:
                     # Try to find it by name match across namespaces
                     dep_name = dep_id.split(".")[-1]
-                    for other_id, other_component in sorted(all_components.items()):  # ✅ SORT for determinism
-                        if other_component.name == dep_name and other_id != component_id:
+                    for other_id in name_index.get(dep_name, ()):
+                        if other_id != component_id:
                             # Extract namespaces to check if it's cross-namespace
                             source_namespace = component_id.split(".")[0]
                             target_namespace = other_id.split(".")[0]
@@ -343,8 +368,9 @@ class DependencyParser:
             if not original_id:
                 continue
 
-            # Construct FQDN: {namespace}.{original_id}
-            fqdn = f"{namespace}.{original_id}"
+            # Construct FQDN: {namespace}.{original_id}, interned so the
+            # dict/set lookups keyed on it hit the identity fast path
+            fqdn = sys.intern(f"{namespace}.{original_id}")
 
             node = Node(
                 id=fqdn,  # FQDN as primary identifier
@@ -386,20 +412,25 @@ class DependencyParser:
                     # Store module with namespace
                     self.modules.add(f"{namespace}.{module_path}")
         
+        # Bare-name fallback map, built once: the old code re-sorted and
+        # rescanned every component per relationship (O(R·N log N)).
+        # setdefault keeps the first id in sorted order, matching the
+        # winner the sorted scan picked.  # ✅ SORT (once) for determinism
+        name_to_id: Dict[str, str] = {}
+        for comp_id, comp_node in sorted(self.components.items()):
+            name_to_id.setdefault(comp_node.name, comp_id)
+
         processed_relationships = 0
         for rel_dict in relationships:
             caller_id = rel_dict.get("caller", "")
             callee_id = rel_dict.get("callee", "")
             is_resolved = rel_dict.get("is_resolved", False)
-            
+
             caller_component_id = component_id_mapping.get(caller_id)
-            
+
             callee_component_id = component_id_mapping.get(callee_id)
             if not callee_component_id:
-                for comp_id, comp_node in sorted(self.components.items()):  # ✅ SORT for determinism
-                    if comp_node.name == callee_id:
-                        callee_component_id = comp_id
-                        break
+                callee_component_id = name_to_id.get(callee_id)
             
             if caller_component_id and caller_component_id in self.components:
                 if callee_component_id:
@@ -438,8 +469,15 @@ class DependencyParser:
         if dir_name:
             os.makedirs(dir_name, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
-        
+        # result is already insertion-ordered by sorted component id, so no
+        # sort option is needed; orjson writes UTF-8 bytes directly instead
+        # of building an intermediate str
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
+
         logger.debug(f"Saved {len(self.components)} components to {output_path}")
         return result
@@ -1,7 +1,11 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+import hashlib
+import json
 import os
 from codewiki.src.config import Config
 from codewiki.src.be.dependency_analyzer.ast_parser import DependencyParser
+from codewiki.src.be.dependency_analyzer.models.core import Node
+from codewiki.src.be.dependency_analyzer.utils.file_index import FileIndex
 from codewiki.src.be.dependency_analyzer.topo_sort import build_graph_from_components, get_leaf_nodes
 from codewiki.src.be.dependency_analyzer.validation import validate_graph_completeness
 from codewiki.src.utils import file_manager
@@ -12,10 +16,55 @@ logger = logging.getLogger(__name__)
 
 class DependencyGraphBuilder:
     """Handles dependency analysis and graph building."""
-    
+
     def __init__(self, config: Config):
         self.config = config
-    
+
+    def _compute_source_fingerprint(self) -> str:
+        """
+        Fingerprint the source tree without reading file contents.
+
+        Hashes every (relative_path, mtime_ns, size) triple under each
+        source path, plus the include/exclude patterns so a pattern change
+        busts the cache. One stat-only walk — cheap even on large repos.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(repr((self.config.include_patterns, self.config.exclude_patterns)).encode())
+        for source_path in self.config.all_source_paths:
+            for dirpath, dirnames, filenames in os.walk(source_path):
+                dirnames[:] = sorted(d for d in dirnames if d != '.git')
+                for filename in sorted(filenames):
+                    full_path = os.path.join(dirpath, filename)
+                    try:
+                        stat = os.stat(full_path)
+                    except OSError:
+                        continue
+                    rel_path = os.path.relpath(full_path, source_path)
+                    hasher.update(f"{rel_path}\x00{stat.st_mtime_ns}\x00{stat.st_size}\n".encode())
+        return hasher.hexdigest()
+
+    def _load_cached_components(
+        self, dependency_graph_path: str, fingerprint_path: str, fingerprint: str
+    ) -> Optional[Dict[str, Node]]:
+        """
+        Load the saved dependency graph if the source fingerprint matches.
+
+        Returns None on any mismatch or load failure, in which case the
+        caller reparses from scratch.
+        """
+        if not (os.path.exists(dependency_graph_path) and os.path.exists(fingerprint_path)):
+            return None
+        try:
+            with open(fingerprint_path, 'r', encoding='utf-8') as f:
+                if f.read().strip() != fingerprint:
+                    return None
+            with open(dependency_graph_path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+            return {component_id: Node.model_validate(data) for component_id, data in raw.items()}
+        except Exception as e:
+            logger.warning(f"Failed to load cached dependency graph, reparsing: {e}")
+            return None
+
     def build_dependency_graph(self) -> tuple[Dict[str, Any], List[str]]:
         """
         Build and save dependency graph, returning components and leaf nodes.
@@ -54,26 +103,54 @@ class DependencyGraphBuilder:
         else:
             logger.info(f"📁 Single-path mode: analyzing {repo_paths[0]}")
 
-        parser = DependencyParser(
-            repo_paths if len(repo_paths) > 1 else repo_paths[0],
-            include_patterns=include_patterns,
-            exclude_patterns=exclude_patterns
+        # Reuse the saved graph when no source file changed since it was
+        # written — a stat-only fingerprint check turns repeat runs on an
+        # unchanged tree into a JSON load instead of a full reparse
+        fingerprint = self._compute_source_fingerprint()
+        fingerprint_path = os.path.join(
+            self.config.dependency_graph_dir,
+            f"{sanitized_repo_name}_dependency_graph.fingerprint"
         )
+        components = self._load_cached_components(dependency_graph_path, fingerprint_path, fingerprint)
 
-        filtered_folders = None
-        # if os.path.exists(filtered_folders_path):
-        #     logger.debug(f"Loading filtered folders from {filtered_folders_path}")
-        #     filtered_folders = file_manager.load_json(filtered_folders_path)
-        # else:
-        #     # Parse repository
-        #     filtered_folders = parser.filter_folders()
-        #     # Save filtered folders
-        #     file_manager.save_json(filtered_folders, filtered_folders_path)
-
-        # Parse repository
-        logger.info("🔍 Parsing repository files...")
-        components = parser.parse_repository(filtered_folders)
-        logger.info(f"   └─ Parsed {len(components)} components total")
+        if components is not None:
+            logger.info(f"⚡ Dependency graph cache hit (sources unchanged)")
+            logger.info(f"   └─ Loaded {len(components)} components from {dependency_graph_path}")
+        else:
+            # Per-file parse cache: when only some files changed since the
+            # last run, the parser reuses cached output for the rest
+            file_index = FileIndex(os.path.join(
+                self.config.dependency_graph_dir,
+                f"{sanitized_repo_name}_file_index.sqlite"
+            ))
+            parser = DependencyParser(
+                repo_paths if len(repo_paths) > 1 else repo_paths[0],
+                include_patterns=include_patterns,
+                exclude_patterns=exclude_patterns,
+                file_index=file_index
+            )
+
+            filtered_folders = None
+            # if os.path.exists(filtered_folders_path):
+            #     logger.debug(f"Loading filtered folders from {filtered_folders_path}")
+            #     filtered_folders = file_manager.load_json(filtered_folders_path)
+            # else:
+            #     # Parse repository
+            #     filtered_folders = parser.filter_folders()
+            #     # Save filtered folders
+            #     file_manager.save_json(filtered_folders, filtered_folders_path)
+
+            # Parse repository
+            logger.info("🔍 Parsing repository files...")
+            components = parser.parse_repository(filtered_folders)
+            logger.info(f"   └─ Parsed {len(components)} components total")
+
+            # Save dependency graph and the fingerprint it was built from
+            file_index.close()
+            parser.save_dependency_graph(dependency_graph_path)
+            with open(fingerprint_path, 'w', encoding='utf-8') as f:
+                f.write(fingerprint)
+            logger.info(f"   └─ Saved dependency graph to: {dependency_graph_path}")
 
         # Log component type breakdown
         type_counts = {}
@@ -85,10 +162,6 @@ class DependencyGraphBuilder:
         for comp_type, count in sorted(type_counts.items(), key=lambda x: x[1], reverse=True):
             logger.info(f"      • {comp_type}: {count}")
 
-        # Save dependency graph
-        parser.save_dependency_graph(dependency_graph_path)
-        logger.info(f"   └─ Saved dependency graph to: {dependency_graph_path}")
-        
         # Build graph for traversal
         graph = build_graph_from_components(components)
 
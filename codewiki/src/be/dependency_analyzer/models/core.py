@@ -1,10 +1,18 @@
+import dataclasses
+from dataclasses import dataclass, field
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any, Set
 from datetime import datetime
 
 
 
-class Node(BaseModel):
+# Plain slotted dataclass rather than a pydantic model: the parser fully
+# controls Node inputs, so per-field validation on every construction was
+# pure overhead, and slots drop the per-instance __dict__ — both matter at
+# tens of thousands of components. model_dump/model_validate are kept as
+# thin compatibility shims for the serialization call sites.
+@dataclass(slots=True)
+class Node:
     id: str  # FQDN format: {namespace}.{original_id}
 
     name: str
@@ -15,7 +23,7 @@ class Node(BaseModel):
 
     relative_path: str
 
-    depends_on: Set[str] = set()
+    depends_on: Set[str] = field(default_factory=set)
 
     source_code: Optional[str] = None
 
@@ -47,6 +55,20 @@ class Node(BaseModel):
     def get_display_name(self) -> str:
         return self.display_name or self.name
 
+    def model_dump(self, mode: str = "python") -> Dict[str, Any]:
+        data = {f.name: getattr(self, f.name) for f in dataclasses.fields(self)}
+        # JSON mode mirrors pydantic: sets are not JSON-serializable
+        data["depends_on"] = sorted(data["depends_on"]) if mode == "json" else set(data["depends_on"])
+        return data
+
+    @classmethod
+    def model_validate(cls, data: Dict[str, Any]) -> "Node":
+        known = {f.name for f in dataclasses.fields(cls)}
+        kwargs = {key: value for key, value in data.items() if key in known}
+        if not isinstance(kwargs.get("depends_on", set()), set):
+            kwargs["depends_on"] = set(kwargs["depends_on"])
+        return cls(**kwargs)
+
 
 class CallRelationship(BaseModel):
     caller: str
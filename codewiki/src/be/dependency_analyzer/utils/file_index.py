@@ -0,0 +1,103 @@
+"""
+File Index
+
+Per-file parse cache backing incremental call graph analysis. Stores each
+file's extracted functions and relationships in SQLite keyed by absolute
+path (one index serves all source trees in multi-path mode), with the
+(mtime_ns, size) pair observed at parse time. On a rebuild, files whose
+stat signature is unchanged reuse the cached parse output and only modified
+files go through the AST parsers again.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+from codewiki.src.be.dependency_analyzer.models.core import Node, CallRelationship
+
+logger = logging.getLogger(__name__)
+
+
+class FileIndex:
+    """SQLite-backed cache of per-file parse results."""
+
+    def __init__(self, db_path: str):
+        dir_name = os.path.dirname(db_path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS file_index ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, blob TEXT)"
+        )
+        self._conn.commit()
+
+    def load(
+        self, base_dir: str, rel_path: str
+    ) -> Optional[Tuple[Dict[str, Node], List[CallRelationship]]]:
+        """
+        Return the cached parse output for a file, or None when the file
+        changed since it was indexed (or was never indexed).
+        """
+        # Keyed by absolute path: one index serves every source tree in
+        # multi-path mode, and the same relative path (src/index.ts in two
+        # packages) must not collide across trees — with matching stat
+        # signatures a bare relative key would return the other
+        # repository's parse output
+        full_path = os.path.join(base_dir, rel_path)
+        try:
+            stat = os.stat(full_path)
+        except OSError:
+            return None
+        row = self._conn.execute(
+            "SELECT mtime_ns, size, blob FROM file_index WHERE path = ?", (full_path,)
+        ).fetchone()
+        if row is None or row[0] != stat.st_mtime_ns or row[1] != stat.st_size:
+            return None
+        try:
+            payload = json.loads(row[2])
+            functions = {
+                func_id: Node.model_validate(data)
+                for func_id, data in payload["functions"].items()
+            }
+            relationships = [
+                CallRelationship.model_validate(data) for data in payload["relationships"]
+            ]
+            return functions, relationships
+        except Exception as e:
+            logger.warning(f"Dropping unreadable file index entry for {rel_path}: {e}")
+            return None
+
+    def store(
+        self,
+        base_dir: str,
+        rel_path: str,
+        functions: Dict[str, Node],
+        relationships: List[CallRelationship],
+    ) -> None:
+        """Record a file's parse output under its current stat signature."""
+        full_path = os.path.join(base_dir, rel_path)
+        try:
+            stat = os.stat(full_path)
+        except OSError:
+            return
+        payload = json.dumps({
+            "functions": {
+                func_id: func.model_dump(mode='json') for func_id, func in functions.items()
+            },
+            "relationships": [rel.model_dump(mode='json') for rel in relationships],
+        })
+        self._conn.execute(
+            "INSERT OR REPLACE INTO file_index (path, mtime_ns, size, blob) VALUES (?, ?, ?, ?)",
+            (full_path, stat.st_mtime_ns, stat.st_size, payload),
+        )
+
+    def commit(self) -> None:
+        """Flush pending writes; called once per analysis run."""
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
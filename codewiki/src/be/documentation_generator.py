@@ -25,7 +25,7 @@ from codewiki.src.be.prompt_template import (
     format_repo_overview_prompt,
     format_module_overview_prompt,
 )
-from codewiki.src.be.cluster_modules import cluster_modules
+from codewiki.src.be.cluster_modules import cluster_modules_async
 from codewiki.src.config import (
     Config,
     FIRST_MODULE_TREE_FILENAME,
@@ -204,6 +204,25 @@ class DocumentationGenerator:
 
         if len(module_tree) > 0:
             logger.info(f"├─ Processing {len(processing_order)} modules...")
+
+            # Leaf modules only read code, never each other's docs, so
+            # consecutive leaves in the bottom-up order are independent and
+            # run as one concurrent batch. A parent is reached only after
+            # its children, and flushing the pending batch before every
+            # parent (and before the repo overview) preserves that ordering.
+            pending_leaf_batch = []
+
+            async def flush_leaf_batch():
+                nonlocal final_module_tree
+                if not pending_leaf_batch:
+                    return
+                import time
+                start_time = time.time()
+                final_module_tree = await self.agent_orchestrator.process_modules(list(pending_leaf_batch))
+                elapsed = time.time() - start_time
+                logger.info(f"│  │  └─ ✅ Batch of {len(pending_leaf_batch)} leaf module{'s' if len(pending_leaf_batch) > 1 else ''} generated in {elapsed:.2f}s")
+                pending_leaf_batch.clear()
+
             for idx, (module_path, module_name) in enumerate(processing_order, 1):
                 try:
                     # Get the module info from the tree
@@ -242,10 +261,6 @@ class DocumentationGenerator:
                         if len(files_with_components) > 3:
                             logger.debug(f"│  │     └─ ... and {len(files_with_components) - 3} more files")
 
-                        logger.debug(f"│  │  └─ Calling LLM for leaf module documentation...")
-                        import time
-                        start_time = time.time()
-
                         # HIERARCHICAL OUTPUT: Create nested directory based on module_path
                         nested_working_dir = self._get_nested_working_dir(working_dir, module_path)
 
@@ -253,12 +268,16 @@ class DocumentationGenerator:
                         file_manager.ensure_directory(nested_working_dir)
                         logger.debug(f"│  │  └─ Ensured nested directory: {nested_working_dir}")
 
-                        final_module_tree = await self.agent_orchestrator.process_module(
-                            module_name, components, module_info["components"], module_path, nested_working_dir
+                        pending_leaf_batch.append(
+                            (module_name, components, module_info["components"], module_path, nested_working_dir)
                         )
-                        elapsed = time.time() - start_time
-                        logger.info(f"│  │     └─ ✅ Generated in {elapsed:.2f}s")
+                        logger.debug(f"│  │  └─ Queued for concurrent leaf batch")
                     else:
+                        # Children of this parent are in the pending batch
+                        # (or already done); their docs must exist before
+                        # the parent overview reads them
+                        await flush_leaf_batch()
+
                         logger.info(f"│  ├─ [{idx}/{len(processing_order)}] 📁 Parent module: {module_key}")
                         logger.info(f"│  │  ├─ Children: {len(module_info.get('children', {}))} sub-modules")
                         logger.debug(f"│  │  └─ Calling LLM for parent module overview...")
@@ -287,6 +306,9 @@ class DocumentationGenerator:
                     # Continue processing other modules (graceful degradation)
                     continue
 
+            # Any leaves queued after the last parent still need processing
+            await flush_leaf_batch()
+
             # Generate repo overview
             logger.info(f"├─ 📚 Generating repository overview...")
             import time
@@ -422,7 +444,7 @@ class DocumentationGenerator:
                 module_tree = file_manager.load_json(first_module_tree_path)
             else:
                 logger.debug(f"Module tree not found at {module_tree_path}, clustering modules")
-                module_tree = cluster_modules(leaf_nodes, components, self.config)
+                module_tree = await cluster_modules_async(leaf_nodes, components, self.config)
                 file_manager.save_json(module_tree, first_module_tree_path)
 
             # === SYNTHETIC_MODULE_PATCH: Prevent context overflow ===
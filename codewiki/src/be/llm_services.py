@@ -344,7 +344,8 @@ def call_llm(
     prompt: str,
     config: Config,
     model: str = None,
-    temperature: float = 0.0
+    temperature: float = 0.0,
+    system: str = None
 ) -> str:
     """
     Call LLM with the given prompt, with comprehensive error context.
@@ -354,6 +355,10 @@ def call_llm(
         config: Configuration containing LLM settings
         model: Model name (defaults to config.main_model)
         temperature: Temperature setting
+        system: Optional system message. Callers that repeat a large static
+            instruction block across calls should pass it here: as the first
+            message it forms a stable prefix that provider-side prompt
+            caching can serve at reduced cost and latency.
 
     Returns:
         LLM response text
@@ -416,9 +421,13 @@ def call_llm(
             temperature_supported = getattr(config, 'main_temperature_supported', True)
 
         # Build kwargs with dynamic parameter name
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
         kwargs = {
             "model": model,
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": messages,
             max_token_field: max_tokens_value
         }
 
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 # Import Flamingo markdown guidelines and custom instructions (dynamically loaded from env vars)
 from codewiki.src.be.flamingo_guidelines import (
     get_guidelines_section,
@@ -1038,9 +1040,32 @@ def format_user_prompt(module_name: str, core_component_ids: list[str], componen
 
 
 
-def format_cluster_prompt(potential_core_components: str, module_tree: dict[str, any] = {}, module_name: str = None) -> str:
+def _split_cluster_template(template: str) -> tuple[str, str]:
+    """
+    Split a cluster template into (dynamic context, static instructions).
+
+    Everything from the CRITICAL INSTRUCTIONS marker onward is identical for
+    every call of that template, so it is sent as a stable system segment;
+    provider-side prompt caching (OpenAI caches message prefixes
+    automatically) then serves it at reduced cost for each clustering call
+    after the first.
+    """
+    context, marker, instructions = template.partition('**CRITICAL INSTRUCTIONS:**')
+    return context.strip(), (marker + instructions).strip()
+
+
+_CLUSTER_REPO_CONTEXT, _CLUSTER_REPO_INSTRUCTIONS = _split_cluster_template(CLUSTER_REPO_PROMPT)
+_CLUSTER_MODULE_CONTEXT, _CLUSTER_MODULE_INSTRUCTIONS = _split_cluster_template(CLUSTER_MODULE_PROMPT)
+
+
+def format_cluster_prompt(potential_core_components: str, module_tree: dict[str, any] = {}, module_name: str = None) -> tuple[str, str]:
     """
     Format the cluster prompt with potential core components and module tree.
+
+    Returns:
+        (system_prompt, user_prompt): the static instruction block as a
+        cache-friendly system segment, and the per-call context (components,
+        module tree) as the user message.
     """
     import logging
     logger = logging.getLogger(__name__)
@@ -1083,26 +1108,64 @@ def format_cluster_prompt(potential_core_components: str, module_tree: dict[str,
     # FIXED: Use manual string replacement instead of .format()
     # potential_core_components might contain code with curly braces
     if module_tree == {}:
-        result = CLUSTER_REPO_PROMPT
+        system_prompt = _CLUSTER_REPO_INSTRUCTIONS
+        result = _CLUSTER_REPO_CONTEXT
         result = result.replace('{potential_core_components}', potential_core_components)
         logger.info(f"   ├─ Base CLUSTER_REPO_PROMPT length: {len(CLUSTER_REPO_PROMPT)} chars")
     else:
-        result = CLUSTER_MODULE_PROMPT
+        system_prompt = _CLUSTER_MODULE_INSTRUCTIONS
+        result = _CLUSTER_MODULE_CONTEXT
         result = result.replace('{potential_core_components}', potential_core_components)
         result = result.replace('{module_tree}', formatted_module_tree)
         result = result.replace('{module_name}', module_name)
         logger.info(f"   ├─ Base CLUSTER_MODULE_PROMPT length: {len(CLUSTER_MODULE_PROMPT)} chars")
 
-    logger.info(f"   ├─ Total assembled prompt: {len(result)} chars (~{len(result) // 4} tokens)")
+    logger.info(f"   ├─ Static instruction segment: {len(system_prompt)} chars (sent as system message)")
+    logger.info(f"   ├─ Total assembled prompt: {len(system_prompt) + len(result)} chars (~{(len(system_prompt) + len(result)) // 4} tokens)")
     logger.info(f"   └─ ✅ Prompt ready for LLM invocation")
 
-    return result
+    return system_prompt, result
+
+
+def _render_custom_section(custom_instructions: str = None) -> str:
+    """Wrap runtime custom instructions in their prompt section, or return ''."""
+    if custom_instructions and custom_instructions.strip():
+        # NOTE: Braces already escaped in config.py:151 via escape_format_braces()
+        # F-strings do NOT process braces in substituted variables, so no double-escape needed.
+        # See flamingo_guidelines.py:64-73 for the escape strategy explanation.
+        return f"\n\n<CUSTOM_INSTRUCTIONS>\n{custom_instructions}\n</CUSTOM_INSTRUCTIONS>"
+    return ""
+
 
+@lru_cache(maxsize=8)
+def _system_prompt_base(custom_instructions: str = None) -> str:
+    """
+    SYSTEM_PROMPT with the custom-instructions section pre-substituted.
+
+    The {module_name}/{display_name} placeholders are left in place. The
+    instruction set is fixed for a whole run, so this big substitution
+    happens once per run instead of once per module.
+    """
+    return SYSTEM_PROMPT.replace('{custom_instructions}', _render_custom_section(custom_instructions))
 
+
+@lru_cache(maxsize=8)
+def _leaf_system_prompt_base(custom_instructions: str = None) -> str:
+    """LEAF_SYSTEM_PROMPT with the custom-instructions section pre-substituted."""
+    return LEAF_SYSTEM_PROMPT.replace('{custom_instructions}', _render_custom_section(custom_instructions))
+
+
+@lru_cache(maxsize=256)
 def format_system_prompt(module_name: str, custom_instructions: str = None) -> str:
     """
     Format the system prompt with module name and optional custom instructions.
 
+    Pure function of its arguments, so results are memoized: re-creating an
+    agent for the same (module, instructions) pair reuses the assembled prompt.
+    The static portion (custom-instructions substitution) is cached separately
+    in _system_prompt_base, so a cache miss for a new module only pays the
+    cheap module-name interpolation.
+
     Args:
         module_name: Name of the module to document
         custom_instructions: Optional custom instructions to append (combined string from config.get_prompt_addition())
@@ -1116,13 +1179,7 @@ def format_system_prompt(module_name: str, custom_instructions: str = None) -> s
     logger.info("📝 Prompt Assembly Stage - SYSTEM_PROMPT (complex modules)")
     logger.info(f"   ├─ Template: SYSTEM_PROMPT (complex modules)")
     logger.info(f"   ├─ Module name: {module_name}")
-
-    custom_section = ""
     if custom_instructions and custom_instructions.strip():
-        # NOTE: Braces already escaped in config.py:151 via escape_format_braces()
-        # F-strings do NOT process braces in substituted variables, so no double-escape needed.
-        # See flamingo_guidelines.py:64-73 for the escape strategy explanation.
-        custom_section = f"\n\n<CUSTOM_INSTRUCTIONS>\n{custom_instructions}\n</CUSTOM_INSTRUCTIONS>"
         logger.info(f"   ├─ Runtime custom instructions: {len(custom_instructions)} chars")
         logger.info(f"   │  └─ Preview: {custom_instructions[:100]}...")
     else:
@@ -1141,10 +1198,9 @@ def format_system_prompt(module_name: str, custom_instructions: str = None) -> s
     # .format() tries to interpret ANY {text} pattern, causing KeyError/IndexError
     # Manual replacement only replaces EXACT placeholder strings, leaving all other braces untouched
     display_name = format_module_display_name(module_name)
-    result = SYSTEM_PROMPT
+    result = _system_prompt_base(custom_instructions)
     result = result.replace('{module_name}', module_name)
     result = result.replace('{display_name}', display_name)
-    result = result.replace('{custom_instructions}', custom_section)
 
     logger.info(f"   ├─ Base system prompt length: {len(SYSTEM_PROMPT)} chars")
     logger.info(f"   ├─ Total assembled prompt: {len(result)} chars (~{len(result) // 4} tokens)")
@@ -1153,10 +1209,13 @@ def format_system_prompt(module_name: str, custom_instructions: str = None) -> s
     return result.strip()
 
 
+@lru_cache(maxsize=256)
 def format_leaf_system_prompt(module_name: str, custom_instructions: str = None) -> str:
     """
     Format the leaf system prompt with module name and optional custom instructions.
 
+    Memoized like format_system_prompt; see note there.
+
     Args:
         module_name: Name of the module to document
         custom_instructions: Optional custom instructions to append (combined string from config.get_prompt_addition())
@@ -1171,12 +1230,7 @@ def format_leaf_system_prompt(module_name: str, custom_instructions: str = None)
     logger.info(f"   ├─ Template: LEAF_SYSTEM_PROMPT (leaf modules)")
     logger.info(f"   ├─ Module name: {module_name}")
 
-    custom_section = ""
     if custom_instructions and custom_instructions.strip():
-        # NOTE: Braces already escaped in config.py:151 via escape_format_braces()
-        # F-strings do NOT process braces in substituted variables, so no double-escape needed.
-        # See flamingo_guidelines.py:64-73 for the escape strategy explanation.
-        custom_section = f"\n\n<CUSTOM_INSTRUCTIONS>\n{custom_instructions}\n</CUSTOM_INSTRUCTIONS>"
         logger.info(f"   ├─ Runtime custom instructions: {len(custom_instructions)} chars")
         logger.info(f"   │  └─ Preview: {custom_instructions[:100]}...")
     else:
@@ -1195,10 +1249,9 @@ def format_leaf_system_prompt(module_name: str, custom_instructions: str = None)
     # .format() tries to interpret ANY {text} pattern, causing KeyError/IndexError
     # Manual replacement only replaces EXACT placeholder strings, leaving all other braces untouched
     display_name = format_module_display_name(module_name)
-    result = LEAF_SYSTEM_PROMPT
+    result = _leaf_system_prompt_base(custom_instructions)
     result = result.replace('{module_name}', module_name)
     result = result.replace('{display_name}', display_name)
-    result = result.replace('{custom_instructions}', custom_section)
 
     logger.info(f"   ├─ Base system prompt length: {len(LEAF_SYSTEM_PROMPT)} chars")
     logger.info(f"   ├─ Total assembled prompt: {len(result)} chars (~{len(result) // 4} tokens)")
@@ -1,3 +1,4 @@
+import hashlib
 import re
 from pathlib import Path
 from typing import List, Tuple
@@ -29,13 +30,47 @@ def is_complex_module(components: dict[str, any], core_component_ids: list[str])
 
 enc = tiktoken.encoding_for_model("gpt-4")
 
+# The same component blobs are tokenized repeatedly (clustering and each
+# sub-module pass over the same text), and BPE encoding is O(len(text)).
+# Counts are cached keyed by a digest of the text rather than the text
+# itself so the cache doesn't pin multi-MB strings in memory.
+_TOKEN_COUNT_CACHE_MAX = 4096
+_token_count_cache: dict[bytes, int] = {}
+
+
 def count_tokens(text: str) -> int:
     """
     Count the number of tokens in a text.
     """
-    length = len(enc.encode(text))
-    # logger.debug(f"Number of tokens: {length}")
-    return length
+    digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+    cached = _token_count_cache.get(digest)
+    if cached is None:
+        cached = len(enc.encode(text))
+        if len(_token_count_cache) >= _TOKEN_COUNT_CACHE_MAX:
+            _token_count_cache.clear()
+        _token_count_cache[digest] = cached
+    return cached
+
+
+def count_tokens_many(texts: List[str]) -> List[int]:
+    """
+    Count tokens for several texts with a single tokenizer invocation.
+
+    encode_batch releases the GIL and parallelizes internally, so one call
+    over N texts beats N count_tokens calls when most are cache misses;
+    hits are still served from the shared digest cache.
+    """
+    digests = [hashlib.blake2b(text.encode(), digest_size=16).digest() for text in texts]
+    counts = [_token_count_cache.get(digest) for digest in digests]
+    missing = [i for i, count in enumerate(counts) if count is None]
+    if missing:
+        encoded = enc.encode_batch([texts[i] for i in missing])
+        for i, tokens in zip(missing, encoded):
+            counts[i] = len(tokens)
+            if len(_token_count_cache) >= _TOKEN_COUNT_CACHE_MAX:
+                _token_count_cache.clear()
+            _token_count_cache[digests[i]] = counts[i]
+    return counts
 
 
 # ------------------------------------------------------------
@@ -2,6 +2,15 @@ import os
 import json
 from typing import Any, Optional, Dict
 
+# orjson (Rust) encodes/decodes several times faster than stdlib json, which
+# matters for module_tree.json: it grows across the run and is rewritten once
+# per module. It is an optional accelerator, not a dependency — fall back to
+# stdlib json when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ------------------------------------------------------------
 # ---------------------- File Manager ---------------------
@@ -9,26 +18,35 @@ from typing import Any, Optional, Dict
 
 class FileManager:
     """Handles file I/O operations."""
-    
+
     @staticmethod
     def ensure_directory(path: str) -> None:
         """Create directory and all parent directories if they don't exist."""
         # Explicitly use parents=True to create nested directory structures
         # Example: "/docs/Backend/Auth/JWT" creates Backend/, Auth/, and JWT/
         os.makedirs(path, exist_ok=True)  # parents=True is default in Python 3
-    
+
     @staticmethod
     def save_json(data: Any, filepath: str) -> None:
         """Save data as JSON to file."""
+        if orjson is not None:
+            # Bytes out, no text-encoding pass; orjson only supports
+            # 2-space indent but the files are machine-read anyway
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
         with open(filepath, 'w') as f:
             json.dump(data, f, indent=4)
-    
+
     @staticmethod
     def load_json(filepath: str) -> Optional[Dict[str, Any]]:
         """Load JSON from file, return None if file doesn't exist."""
         if not os.path.exists(filepath):
             return None
-        
+
+        if orjson is not None:
+            with open(filepath, 'rb') as f:
+                return orjson.loads(f.read())
         with open(filepath, 'r') as f:
             return json.load(f)
     